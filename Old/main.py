@@ -1,46 +1,220 @@
 # main.py
+import codecs
+import multiprocessing
+import os
 import sys
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog, 
-    QWidget, QTableWidget, QTableWidgetItem
+    QWidget, QTableWidget, QTableWidgetItem, QCheckBox
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal, Qt
 import threading
 
+# Translation table lowering ASCII letters, built once and applied with bytes.translate
+LOWER = bytes.maketrans(
+    bytes(range(256)),
+    bytes(c | 0x20 if 0x41 <= c <= 0x5A else c for c in range(256))
+)
+
+# Size of each raw read when scanning a file
+CHUNK_SIZE = 1 << 20
+
+def open_sequential(filepath: str) -> int:
+    """
+    Open a file for raw reading and hint the kernel that it will be read
+    sequentially and soon, so readahead is enlarged and starts right away.
+
+    :param filepath: Path to the file
+    :return: Raw file descriptor, to be closed by the caller
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+    return fd
+
+@lru_cache(maxsize=32)
+def compile_keyword(keyword: str) -> bytes:
+    """
+    Lower and encode a keyword once; every thread of a search and every
+    repeated search with the same keyword reuse the result.
+    """
+    return keyword.encode('utf-8').translate(LOWER)
+
+def count_line_piece(piece: bytes, keyword_lower: bytes,
+                     keyword_folded: Optional[str]) -> Tuple[int, bytes]:
+    """
+    Count the occurrences of a keyword in a piece of a single line, for lines
+    too long to be held whole.
+
+    :param piece: Bytes of the line, without its newline
+    :param keyword_lower: Lowered, encoded keyword
+    :param keyword_folded: Keyword lowered with str.lower(), None for ASCII keywords
+    :return: Tuple of (occurrence count, bytes to put in front of the next piece:
+             the lowered tail a later occurrence may still start in, followed by
+             a UTF-8 character cut off at the end of the piece)
+    """
+    if keyword_folded is None:
+        low = piece.translate(LOWER)
+        keyword = keyword_lower
+        rest = b''
+    else:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        low = decoder.decode(piece).lower()
+        keyword = keyword_folded
+        rest = decoder.getstate()[0]
+
+    # Occurrences do not overlap, the next one may start where the last one ended
+    count = 0
+    match_end = 0
+    idx = 0
+    while (idx := low.find(keyword, idx)) != -1:
+        count += 1
+        idx = match_end = idx + len(keyword)
+
+    tail = low[max(match_end, len(low) - len(keyword) + 1):]
+    if keyword_folded is not None:
+        tail = tail.encode('utf-8')
+    return count, tail + rest
+
+def scan_file(filepath: str, keyword: str, collect_lines: bool) -> Tuple[int, List[str]]:
+    """
+    Count case-insensitive occurrences of a keyword in a file.
+    Kept at module level so it can be pickled and run in a worker process,
+    where the scan is not limited by the GUI process's GIL.
+
+    :param filepath: Path to the file
+    :param keyword: Keyword to search for
+    :param collect_lines: Also return the matching lines
+    :return: Tuple of (match count, matching lines)
+    """
+    keyword_lower = compile_keyword(keyword)
+
+    # The translate table only lowers ASCII, other keywords take the str.lower() path
+    keyword_folded = None if keyword.isascii() else keyword.lower()
+
+    # Read file in large raw chunks
+    fd = open_sequential(filepath)
+    try:
+        # Count all occurrences of the keyword in the entire file
+        matches = []
+        match_count = 0
+        carry = b''
+
+        # Start of a line outgrowing CHUNK_SIZE, and whether it matched so far
+        long_head = None
+        long_hit = False
+        while True:
+            buf = os.read(fd, CHUNK_SIZE)
+
+            # Scan whole lines only, the trailing partial line waits for the next chunk.
+            # The carry holds no newline, so only the new chunk is searched for one.
+            if buf:
+                cut = buf.rfind(b'\n') + 1
+                if not cut:
+                    carry += buf
+                    if len(carry) > CHUNK_SIZE:
+                        # Too long to keep whole: count the line in place and carry
+                        # only the tail where an occurrence may still start
+                        if long_head is None:
+                            long_head = carry[:CHUNK_SIZE]
+                        count, carry = count_line_piece(carry, keyword_lower, keyword_folded)
+                        match_count += count
+                        long_hit = long_hit or count > 0
+                    continue
+                block, carry = carry + buf[:cut], buf[cut:]
+            else:
+                block, carry = carry, b''
+
+            if long_head is not None:
+                # The first line of the block ends the long line, reported by its start
+                first = block.find(b'\n') + 1 or len(block)
+                count, _ = count_line_piece(block[:first], keyword_lower, keyword_folded)
+                match_count += count
+                if collect_lines and (long_hit or count):
+                    matches.append(long_head.rstrip(b'\r').decode('utf-8', errors='replace'))
+                block = block[first:]
+                long_head = None
+                long_hit = False
+
+            if keyword_folded is not None:
+                # Non-ASCII keyword: pure ASCII chunks cannot contain it,
+                # the others are decoded and lowered with str.lower()
+                if not block.isascii():
+                    text = block.decode('utf-8', errors='replace')
+                    match_count += text.lower().count(keyword_folded)
+                    if collect_lines:
+                        matches.extend(
+                            line.rstrip('\r') for line in text.split('\n')
+                            if keyword_folded in line.lower()
+                        )
+            else:
+                low = block.translate(LOWER)
+                match_count += low.count(keyword_lower)
+
+                # Store each line containing a match, decoding only those lines.
+                # Skipped when only the count is wanted.
+                if collect_lines:
+                    idx = 0
+                    while (idx := low.find(keyword_lower, idx)) != -1:
+                        line_start = block.rfind(b'\n', 0, idx) + 1
+                        line_end = block.find(b'\n', idx)
+                        if line_end == -1:
+                            line_end = len(block)
+                        matches.append(block[line_start:line_end].rstrip(b'\r').decode('utf-8', errors='replace'))
+                        idx = line_end
+
+            if not buf:
+                break
+    finally:
+        os.close(fd)
+
+    return match_count, matches
+
 class SearchThread(QThread):
     """
     Dedicated thread for searching a single file
     """
     search_complete = pyqtSignal(dict)
 
-    def __init__(self, filepath: str, keyword: str, window_id: int):
+    def __init__(self, filepath: str, keyword: str, window_id: int, collect_lines: bool = False,
+                 executor: Optional[Executor] = None):
         super().__init__()
         self.filepath = filepath
         self.keyword = keyword
         self.window_id = window_id
 
+        # Also return the matching lines, not only the match count
+        self.collect_lines = collect_lines
+
+        # Pool the scan runs in, None to scan in this thread
+        self.executor = executor
+
     def run(self):
         """
         Perform search in a background thread
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Read file
-            with open(self.filepath, 'r', encoding='utf-8') as file:
-                # Count all occurrences of the keyword in the entire file
-                matches = []
-                match_count = 0
-                for line in file:
-                    occurrences = line.lower().count(self.keyword.lower())  # Count keyword occurrences in the line
-                    if occurrences > 0:
-                        match_count += occurrences
-                        matches.extend([line.strip()])  # Store each match found in a line
-                
+            # Scan in the worker process pool when there is one
+            if self.executor is not None:
+                match_count, matches = self.executor.submit(
+                    scan_file, self.filepath, self.keyword, self.collect_lines
+                ).result()
+            else:
+                match_count, matches = scan_file(self.filepath, self.keyword, self.collect_lines)
+
             # Calculate processing time
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Prepare result
             result = {
@@ -56,11 +230,12 @@ class SearchThread(QThread):
         
         except Exception as e:
             # Handle file reading errors
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             result = {
                 'window_id': self.window_id,
                 'filepath': self.filepath,
                 'matches': [],
+                'match_count': 0,
                 'error': str(e),
                 'processing_time': processing_time
             }
@@ -73,6 +248,12 @@ class FileSearchApp(QMainWindow):
         
         # Store file paths for search windows
         self.file_paths = []
+
+        # Worker processes running the scans, created on the first search
+        self.process_pool = None
+
+        # Results waiting to be shown in the next batch
+        self.pending_results = []
         
         # Initialize UI
         self.initUI()
@@ -116,6 +297,11 @@ class FileSearchApp(QMainWindow):
         self.keyword_input.setPlaceholderText('Enter search keyword')
         keyword_layout.addWidget(self.keyword_input)
 
+        # Matching lines are only collected when they will be shown
+        self.show_matches_check = QCheckBox('Show matching lines')
+        self.show_matches_check.setChecked(True)
+        keyword_layout.addWidget(self.show_matches_check)
+
         # Global Search Button
         global_search_btn = QPushButton('Search All Windows')
         global_search_btn.clicked.connect(self.start_global_search)
@@ -160,6 +346,9 @@ class FileSearchApp(QMainWindow):
             self.overall_results.setPlainText('Please enter a valid number of windows')
             return
 
+        # One slot per window, filled in by select_file
+        self.file_paths = [''] * num_windows
+
         # Create file selection windows
         for i in range(num_windows):
             # File selection layout
@@ -197,10 +386,6 @@ class FileSearchApp(QMainWindow):
         # Update file input and store file path
         file_input.setText(file_path)
         
-        # Ensure file paths list is large enough
-        while len(self.file_paths) <= window_id:
-            self.file_paths.append('')
-        
         # Store file path
         self.file_paths[window_id] = file_path
 
@@ -215,66 +400,100 @@ class FileSearchApp(QMainWindow):
             return
 
         # Validate file paths
-        if not self.file_paths or len(self.file_paths) == 0:
+        if not any(self.file_paths):
             self.overall_results.setPlainText('Please select files for all windows')
             return
 
         # Clear previous results
+        self.pending_results.clear()
         self.results_table.setRowCount(0)
         self.overall_results.clear()
 
         # Track search start time
-        global_start_time = time.time()
+        global_start_time = time.perf_counter()
+
+        # Scans run in worker processes so several files are searched on several cores
+        # Spawned rather than forked, a fork would copy the Qt state of this process
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(
+                os.cpu_count(), mp_context=multiprocessing.get_context('spawn')
+            )
 
         # Create search threads
         self.search_threads = []
         for i, filepath in enumerate(self.file_paths):
             if filepath:  # Only create thread for windows with selected files
-                thread = SearchThread(filepath, keyword, i+1)
+                thread = SearchThread(filepath, keyword, i+1,
+                                      collect_lines=self.show_matches_check.isChecked(),
+                                      executor=self.process_pool)
                 thread.search_complete.connect(self.process_search_result)
                 thread.start()
                 self.search_threads.append(thread)
 
     def process_search_result(self, result):
         """
-        Process search results from a thread
+        Queue search results from a thread.
+        Results arriving within 50 ms of each other are shown together.
         """
-        # Add row to results table
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
-        
-        # Window ID
-        self.results_table.setItem(row, 0, QTableWidgetItem(str(result['window_id'])))
-        
-        # File Path
-        self.results_table.setItem(row, 1, QTableWidgetItem(result['filepath']))
-        
-        # Matches (display the total count of keyword occurrences)
-        matches_str = str(result['match_count'])
-        self.results_table.setItem(row, 2, QTableWidgetItem(matches_str))
-        
-        # Processing Time
-        time_str = f"{result['processing_time']:.4f}"
-        self.results_table.setItem(row, 3, QTableWidgetItem(time_str))
-
-        # Prepare overall results text
-        overall_result_text = [
-            f"Window {result['window_id']} Results:",
-            f"File: {result['filepath']}",
-            f"Matches: {result['match_count']}",  # Show match count only once
-            f"Processing Time: {result['processing_time']:.4f} seconds"
-        ]
+        if not self.pending_results:
+            QTimer.singleShot(50, self.flush_search_results)
+        self.pending_results.append(result)
+
+    def flush_search_results(self):
+        """
+        Show all queued search results with a single table repaint
+        """
+        pending, self.pending_results = self.pending_results, []
+
+        # Add rows to results table
+        first_row = self.results_table.rowCount()
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            self.results_table.setRowCount(first_row + len(pending))
+            for row, result in enumerate(pending, start=first_row):
+                # Window ID
+                self.results_table.setItem(row, 0, QTableWidgetItem(str(result['window_id'])))
+            
+                # File Path
+                self.results_table.setItem(row, 1, QTableWidgetItem(result['filepath']))
+            
+                # Matches (display the total count of keyword occurrences)
+                matches_str = str(result['match_count'])
+                self.results_table.setItem(row, 2, QTableWidgetItem(matches_str))
+            
+                # Processing Time
+                time_str = f"{result['processing_time']:.4f}"
+                self.results_table.setItem(row, 3, QTableWidgetItem(time_str))
+        finally:
+            # Never leave the table frozen, even when a result could not be shown
+            self.results_table.setUpdatesEnabled(True)
+
+        for result in pending:
+            # Prepare overall results text
+            overall_result_text = [
+                f"Window {result['window_id']} Results:",
+                f"File: {result['filepath']}",
+                f"Matches: {result['match_count']}",  # Show match count only once
+                f"Processing Time: {result['processing_time']:.4f} seconds"
+            ]
         
-        # Add matches to the text
-        if result['matches']:
-            overall_result_text.append("\nMatches:")
-            overall_result_text.append("\n".join(result['matches']))  # Add the matches here only once
+            # Add matches to the text
+            if result['matches']:
+                overall_result_text.append("\nMatches:")
+                overall_result_text.append("\n".join(result['matches']))  # Add the matches here only once
+
+            overall_result_text.append("-" * 50+ "\n") # Separator line
 
-        overall_result_text.append("-" * 50+ "\n") # Separator line
+            # Append to the overall results display without re-reading the whole document
+            self.overall_results.append("\n".join(overall_result_text))
 
-        # Update the overall results display
-        current_text = self.overall_results.toPlainText()
-        self.overall_results.setPlainText(current_text + "\n".join(overall_result_text))
+    def closeEvent(self, event):
+        """
+        Stop the worker processes when the window closes
+        """
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
 
 
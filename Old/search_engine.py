@@ -1,62 +1,216 @@
-import os
-import threading
+import mmap
 import time
-from queue import Queue
-from typing import List, Dict, Optional, Tuple
-
-class ThreadSafeSearchEngine:
-    def __init__(self):
-        """
-        Initialize the thread-safe search engine for single file search
-        """
-        self.results_queue = Queue()
-        self.search_results: List[str] = []
-        self.results_lock = threading.Lock()
-        self.processing_time = 0.0
-
-    def search_file(self, filepath: str, keyword: str) -> Tuple[Optional[List[str]], float]:
-        """
-        Search for keyword in a single file.
-        
-        :param filepath: Path to the file to search
-        :param keyword: Keyword to search for
-        :return: Tuple of (matching lines or None, processing time)
-        """
-        start_time = time.time()
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                # Use generator for memory efficiency
-                matches = [
-                    line.strip() for line in file 
-                    if keyword.lower() in line.lower()
-                ]
-                end_time = time.time()
-                processing_time = end_time - start_time
-                return (matches if matches else None, processing_time)
-        except (IOError, PermissionError) as e:
-            end_time = time.time()
-            processing_time = end_time - start_time
-            print(f"Error reading file {filepath}: {e}")
-            return (None, processing_time)
-
-    def perform_search(self, filepath: str, keyword: str) -> Tuple[List[str], float]:
-        """
-        Perform search on a single file and store results
-        
-        :param filepath: Path to the file
-        :param keyword: Keyword to search for
-        :return: Tuple of (search results, processing time)
-        """
-        try:
-            results, processing_time = self.search_file(filepath, keyword)
-            
-            # Use lock to safely update results
-            with self.results_lock:
-                if results:
-                    self.search_results.extend(results)
-                self.processing_time = processing_time
-            
-            return results or [], processing_time
-        except Exception as e:
-            print(f"Unexpected error in search: {e}")
-            return [], 0.0
\ No newline at end of file
+from functools import lru_cache
+from typing import BinaryIO, List, Optional, Tuple
+
+# Size of each read when a file is streamed through the scan
+CHUNK_SIZE = 1 << 20
+
+@lru_cache(maxsize=128)
+def _compile_keyword(keyword: str) -> Tuple[bytes, bool]:
+    """
+    Matcher for a keyword, built once per keyword and shared by every search with it
+
+    :param keyword: Keyword to search for
+    :return: Tuple of (lowered UTF-8 keyword, whether the file data must be lowered)
+    """
+    # Only used for ASCII keywords, bytes.lower() lowers ASCII letters only
+    keyword_lower = keyword.lower().encode('utf-8')
+    # Without cased ASCII letters, lowering the data cannot create or remove a match
+    return keyword_lower, keyword_lower.upper() != keyword_lower
+
+def _scan_lines_unicode(data: bytes, keyword_folded: str, max_lines: Optional[int] = None) -> Tuple[int, List[str]]:
+    """
+    Find the lines of a block of whole lines that contain a keyword with
+    non-ASCII characters, which bytes.lower() cannot lower. The block is
+    decoded and lowered with str.lower(), like the keyword.
+
+    :param data: Block of whole lines
+    :param keyword_folded: Keyword lowered with str.lower()
+    :param max_lines: Matching lines to return, the rest are only counted; None returns all
+    :return: Tuple of (number of matching lines, first matching lines)
+    """
+    text = data.decode('utf-8', errors='replace')
+
+    # Most blocks hold no match, they are ruled out with a single search
+    if keyword_folded not in text.lower():
+        return 0, []
+
+    matches = []
+    count = 0
+    for line in text.split('\n'):
+        if keyword_folded in line.lower():
+            if max_lines is None or count < max_lines:
+                matches.append(line.strip())
+            count += 1
+    return count, matches
+
+def _scan_lines(data: bytes, keyword: str, max_lines: Optional[int] = None) -> Tuple[int, List[str]]:
+    """
+    Find the lines of a block of whole lines that contain a keyword
+
+    :param data: Block of whole lines, any object with the bytes find methods
+    :param keyword: Keyword to search for
+    :param max_lines: Matching lines to decode, the rest are only counted; None decodes all
+    :return: Tuple of (number of matching lines, first matching lines)
+    """
+    if not keyword.isascii():
+        return _scan_lines_unicode(data, keyword.lower(), max_lines)
+
+    # Scan in the byte domain, only matching lines are decoded
+    matches = []
+    count = 0
+    keyword_lower, needs_lower = _compile_keyword(keyword)
+    data_lower = data.lower() if needs_lower else data
+    idx = 0
+    while (idx := data_lower.find(keyword_lower, idx)) != -1:
+        line_end = data.find(b'\n', idx)
+        if line_end == -1:
+            line_end = len(data)
+        if max_lines is None or count < max_lines:
+            line_start = data.rfind(b'\n', 0, idx) + 1
+            matches.append(data[line_start:line_end].decode('utf-8', errors='replace').strip())
+        count += 1
+
+        # Resume at the next line, each matching line is reported once
+        idx = line_end
+    return count, matches
+
+def _contains(data: bytes, keyword: str) -> bool:
+    """
+    Whether a piece of a line contains a keyword in any case
+
+    :param data: Bytes of the piece
+    :param keyword: Keyword to search for
+    :return: True when the keyword occurs in the piece
+    """
+    if not keyword.isascii():
+        return keyword.lower() in data.decode('utf-8', errors='replace').lower()
+    keyword_lower, needs_lower = _compile_keyword(keyword)
+    return keyword_lower in (data.lower() if needs_lower else data)
+
+def _scan_stream(file: BinaryIO, keyword: str, max_lines: int, size: Optional[int] = None) -> Tuple[int, List[str]]:
+    """
+    Scan a file in fixed chunks, so the GIL is released while each chunk is read.
+    Only the partial line after the last newline is carried between chunks; a
+    line outgrowing CHUNK_SIZE is searched piece by piece and reported by its
+    first CHUNK_SIZE bytes, so memory stays bounded by about two chunks.
+
+    :param file: File opened in binary mode
+    :param keyword: Keyword to search for
+    :param max_lines: Matching lines to decode, the rest are only counted
+    :param size: Bytes to scan from the current position, None scans to the end of the file
+    :return: Tuple of (number of matching lines, first matching lines)
+    """
+    count = 0
+    matches = []
+    carry = b''
+    scanned = 0
+
+    # Start of a line outgrowing CHUNK_SIZE, and whether it matched so far
+    long_head = None
+    long_hit = False
+
+    # Bytes kept between pieces of a long line, enough for the keyword in any encoding
+    overlap = 4 * len(keyword)
+    while True:
+        chunk = file.read(CHUNK_SIZE if size is None else min(CHUNK_SIZE, size - scanned))
+        scanned += len(chunk)
+        if chunk:
+            # Cut at the last newline and carry the partial line into the next block,
+            # so no match or matching line is split across blocks. The carry holds no
+            # newline, so only the new chunk is searched for one.
+            cut = chunk.rfind(b'\n') + 1
+            if not cut:
+                carry += chunk
+                if len(carry) > CHUNK_SIZE:
+                    # Too long to keep whole: search the line in place and keep only
+                    # the tail where a match may still start
+                    if long_head is None:
+                        long_head = carry[:CHUNK_SIZE]
+                    long_hit = long_hit or _contains(carry, keyword)
+                    carry = carry[-overlap:]
+                continue
+            block, carry = carry + chunk[:cut], chunk[cut:]
+        else:
+            block, carry = carry, b''
+
+        if long_head is not None:
+            # The first line of the block ends the long line, reported by its start
+            first = block.find(b'\n') + 1 or len(block)
+            if long_hit or _contains(block[:first], keyword):
+                if len(matches) < max_lines:
+                    matches.append(long_head.decode('utf-8', errors='replace').strip())
+                count += 1
+            block = block[first:]
+            long_head = None
+            long_hit = False
+
+        block_count, block_matches = _scan_lines(block, keyword, max_lines - len(matches))
+        count += block_count
+        matches.extend(block_matches)
+        if not chunk:
+            return count, matches
+
+def count_matches(filepath: str, keyword: str, max_lines: int) -> Tuple[int, List[str], float]:
+    """
+    Count the matching lines of a file, decoding only the first of them.
+    Kept at module level so it can be pickled and run in a worker process.
+
+    :param filepath: Path to the file
+    :param keyword: Keyword to search for
+    :param max_lines: Matching lines to decode, the rest are only counted
+    :return: Tuple of (number of matching lines, first matching lines, processing time)
+    :raises OSError: When the file cannot be read
+    """
+    start_time = time.perf_counter_ns()
+
+    # Unbuffered, so each chunk is read straight into its bytes object
+    with open(filepath, 'rb', buffering=0) as file:
+        mm = None
+        if keyword.isascii() and not _compile_keyword(keyword)[1]:
+            try:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Empty files, pipes or no address space left, stream instead
+                pass
+        if mm is not None:
+            # The keyword is searched in the page cache directly, nothing is copied
+            with mm:
+                count, matches = _scan_lines(mm, keyword, max_lines)
+        else:
+            # The scan needs lowered copies, made one chunk at a time
+            count, matches = _scan_stream(file, keyword, max_lines)
+    processing_time = (time.perf_counter_ns() - start_time) / 1e9
+    return count, matches, processing_time
+
+def search_range(filepath: str, keyword: str, start: int, end: int, max_lines: int) -> Tuple[int, List[str]]:
+    """
+    Search the lines starting within a byte range of a file, so that ranges
+    splitting a file are searched independently and each line exactly once.
+    Kept at module level so it can be pickled and run in a worker process.
+
+    :param filepath: Path to the file
+    :param keyword: Keyword to search for
+    :param start: First byte of the range
+    :param end: Byte after the range
+    :param max_lines: Matching lines to decode, the rest are only counted
+    :return: Tuple of (number of matching lines, first matching lines of the range)
+    :raises OSError: When the file cannot be read
+    """
+    with open(filepath, 'rb', buffering=0) as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # A line running into the range belongs to the range before it
+        if start > 0 and mm[start - 1] != ord('\n'):
+            start = mm.find(b'\n', start)
+            start = len(mm) if start == -1 else start + 1
+
+        # The last line starting in the range is searched whole
+        line_end = mm.find(b'\n', end - 1) if end < len(mm) else -1
+        end = len(mm) if line_end == -1 else line_end
+
+        if start >= end:
+            return 0, []
+
+        # Read the range one chunk at a time, so no copy of the whole range is made
+        file.seek(start)
+        return _scan_stream(file, keyword, max_lines, end - start)
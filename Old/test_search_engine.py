@@ -0,0 +1,58 @@
+import search_engine
+from search_engine import count_matches, search_range
+
+
+def test_ranges_split_mid_line_search_each_line_once(tmp_path):
+    path = tmp_path / 'text.txt'
+    data = b''.join(b'line %d hello\n' % i if i % 3 else b'line %d\n' % i for i in range(200))
+    path.write_bytes(data)
+
+    count, matches, _ = count_matches(str(path), 'hello', 1000)
+
+    # Boundaries fall inside lines, right after newlines and on single bytes
+    boundaries = [0, 5, 6, 37, 38, 39, 500, 1001, len(data) - 3, len(data)]
+    range_count = 0
+    range_matches = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        part_count, part_matches = search_range(str(path), 'hello', start, end, 1000)
+        range_count += part_count
+        range_matches.extend(part_matches)
+
+    assert range_count == count == 133
+    assert range_matches == matches
+
+
+def test_line_longer_than_chunk_is_counted_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_engine, 'CHUNK_SIZE', 8)
+    path = tmp_path / 'text.txt'
+    path.write_bytes(b'x' * 50 + b'HEL' + b'LO' + b'y' * 50 + b'hello\nhello\n' + b'z' * 40 + b'\n')
+
+    count, matches, _ = count_matches(str(path), 'Hello', 10)
+
+    assert count == 2
+    assert matches == ['x' * 8, 'hello']
+
+
+def test_range_with_long_lines_matches_whole_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_engine, 'CHUNK_SIZE', 8)
+    path = tmp_path / 'text.txt'
+    data = b'a' * 30 + b'hello\n' + b'b' * 30 + b'\n' + b'hello' + b'c' * 30 + b'\n'
+    path.write_bytes(data)
+
+    first_count, first_matches = search_range(str(path), 'hello', 0, 40, 10)
+    second_count, second_matches = search_range(str(path), 'hello', 40, len(data), 10)
+
+    assert (first_count, first_matches) == (1, ['a' * 8])
+    assert (second_count, second_matches) == (1, ['helloccc'])
+
+
+def test_non_ascii_keyword_matches_any_case(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_text('Über alles\nnothing here\nüber den Fluss\nÜBER\n', encoding='utf-8')
+
+    count, matches, _ = count_matches(str(path), 'Über', 10)
+    range_count, range_matches = search_range(str(path), 'über', 3, path.stat().st_size, 10)
+
+    assert count == 3
+    assert matches == ['Über alles', 'über den Fluss', 'ÜBER']
+    assert (range_count, range_matches) == (2, ['über den Fluss', 'ÜBER'])
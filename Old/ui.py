@@ -1,45 +1,350 @@
+import json
+import multiprocessing
 import os
+import queue
+import sqlite3
 import threading
 import time
-from typing import List, Optional
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 from PyQt5.QtWidgets import (
     QMainWindow, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QTextEdit, QFileDialog, 
+    QLineEdit, QPushButton, QPlainTextEdit, QFileDialog, 
     QWidget, QDialog, QTableWidget, QTableWidgetItem
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
-from search_engine import ThreadSafeSearchEngine
+from PyQt5.QtCore import QObject, QRunnable, QSignalBlocker, QThread, QThreadPool, QTimer, pyqtSignal, Qt
+from search_engine import count_matches, search_range
 
-class SearchThread(QThread):
+# Lines kept by a results display, older lines are dropped beyond this
+MAX_DISPLAY_LINES = 10000
+
+# Matching lines decoded and shown per search, the rest are only counted
+MAX_DISPLAYED_MATCHES = 5000
+
+# Matching lines handed to a results display per append
+DISPLAY_CHUNK_LINES = 1000
+
+# Files larger than this are scanned in a worker process, where the scan does not
+# hold this process's GIL. Smaller ones stay on the search threads, the transfer
+# to a process would cost more than the scan.
+PROCESS_SEARCH_BYTES = 4 << 20
+
+# Files larger than this are split into ranges of at least PARALLEL_RANGE_BYTES,
+# searched by several worker processes at once
+PARALLEL_SEARCH_BYTES = 16 << 20
+PARALLEL_RANGE_BYTES = 4 << 20
+
+# Worker processes for large scans, created by the UI thread before a search is
+# started; search threads only use it, and drop it when a worker died
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the worker processes for large scans, creating them on first use or
+    after a worker died. Only called from the UI thread.
+
+    :return: The process pool
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Spawned rather than forked, a fork would copy the Qt state of this process
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn')
+            )
+        return _process_pool
+
+def _search_ranges(pool: ProcessPoolExecutor, filepath: str, keyword: str, size: int) -> Tuple[int, List[str], float]:
+    """
+    Search a large file split into ranges, one worker process per range
+
+    :param pool: Process pool to search in
+    :param filepath: Path to the file
+    :param keyword: Keyword to search for
+    :param size: Size of the file in bytes
+    :return: Tuple of (number of matching lines, first matching lines in file order, processing time)
+    """
+    start_time = time.perf_counter()
+    ranges = max(1, min(os.cpu_count() or 1, size // PARALLEL_RANGE_BYTES))
+    bounds = [size * i // ranges for i in range(ranges + 1)]
+    futures = [
+        pool.submit(search_range, filepath, keyword, start, end, MAX_DISPLAYED_MATCHES)
+        for start, end in zip(bounds, bounds[1:])
+    ]
+    total = 0
+    results = []
+    for future in futures:
+        count, lines = future.result()
+        total += count
+        results.extend(lines[:MAX_DISPLAYED_MATCHES - len(results)])
+    return total, results, time.perf_counter() - start_time
+
+def _search_in_process(filepath: str, keyword: str, size: int) -> Tuple[int, List[str], float]:
+    """
+    Search a file in worker processes, the calling thread waits without holding the GIL
+
+    :param filepath: Path to the file
+    :param keyword: Keyword to search for
+    :param size: Size of the file in bytes
+    :return: Tuple of (number of matching lines, first matching lines, processing time)
+    :raises OSError: When the file cannot be read
+    """
+    global _process_pool
+    with _process_pool_lock:
+        pool = _process_pool
+    if pool is None:
+        # Dropped by another search since this one was started
+        return count_matches(filepath, keyword, MAX_DISPLAYED_MATCHES)
+    try:
+        if size > PARALLEL_SEARCH_BYTES:
+            return _search_ranges(pool, filepath, keyword, size)
+        return pool.submit(count_matches, filepath, keyword, MAX_DISPLAYED_MATCHES).result()
+    except BrokenProcessPool as e:
+        # A worker died, search here instead; the next search starts a new pool
+        print(f"Search process failed, searching in this process: {e}")
+        with _process_pool_lock:
+            if _process_pool is pool:
+                _process_pool = None
+        return count_matches(filepath, keyword, MAX_DISPLAYED_MATCHES)
+
+# On-disk cache of search results, shared across runs of the application
+CACHE_DB_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'parallel_search.sqlite')
+
+# Searches kept in the on-disk cache, the oldest are deleted beyond this
+MAX_CACHE_ROWS = 1000
+
+# Connection to the on-disk cache, opened on first use; False once it proved unusable.
+# sqlite connections are not safe to share between threads without a lock.
+_cache_db = None
+_cache_db_lock = threading.Lock()
+
+def _open_cache_db() -> Optional[sqlite3.Connection]:
+    """
+    Open the on-disk cache, creating it when missing. Call with _cache_db_lock held.
+
+    :return: The connection, or None when the cache cannot be used
     """
-    Dedicated thread for searching a single file
+    global _cache_db
+    if _cache_db is None:
+        try:
+            os.makedirs(os.path.dirname(CACHE_DB_PATH), exist_ok=True)
+            _cache_db = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+            _cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS searches("
+                "path TEXT, mtime INT, size INT, keyword TEXT, count INT, results TEXT, t REAL, "
+                "PRIMARY KEY(path, mtime, size, keyword))"
+            )
+            _cache_db.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Search cache disabled: {e}")
+            _cache_db = False
+    return _cache_db or None
+
+def _load_cached(filepath: str, mtime_ns: int, size: int, keyword: str) -> Optional[Tuple[int, List[str], float]]:
     """
-    search_complete = pyqtSignal(dict)
+    Look up a search in the on-disk cache
 
-    def __init__(self, window_id: int, filepath: str, keyword: str):
+    :return: Tuple of (number of matching lines, first matching lines, processing time), or None on a miss
+    """
+    with _cache_db_lock:
+        db = _open_cache_db()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT count, results, t FROM searches WHERE path = ? AND mtime = ? AND size = ? AND keyword = ?",
+                (filepath, mtime_ns, size, keyword)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading search cache: {e}")
+            return None
+    if row is None:
+        return None
+    try:
+        return row[0], json.loads(row[1]), row[2]
+    except (TypeError, ValueError) as e:
+        # A damaged row is searched again and overwritten
+        print(f"Error reading search cache: {e}")
+        return None
+
+def _store_cached(filepath: str, mtime_ns: int, size: int, keyword: str,
+                  count: int, results: List[str], processing_time: float):
+    """
+    Save a search in the on-disk cache, replacing the searches of older versions
+    of the file and keeping at most MAX_CACHE_ROWS searches
+    """
+    lines = json.dumps(list(results))
+    with _cache_db_lock:
+        db = _open_cache_db()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "DELETE FROM searches WHERE path = ? AND (mtime != ? OR size != ?)",
+                (filepath, mtime_ns, size)
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (filepath, mtime_ns, size, keyword, count, lines, processing_time)
+            )
+            # Rows get increasing rowids as they are written, the lowest are the oldest
+            db.execute(
+                "DELETE FROM searches WHERE rowid <= (SELECT MAX(rowid) FROM searches) - ?",
+                (MAX_CACHE_ROWS,)
+            )
+            db.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing search cache: {e}")
+
+@lru_cache(maxsize=256)
+def _cached_search(filepath: str, mtime_ns: int, size: int, keyword: str) -> Tuple[int, Tuple[str, ...], float]:
+    """
+    Search a file once per (file version, keyword) for the whole process,
+    backed by the on-disk cache.
+    mtime_ns and size are only part of the key, so a modified file simply misses.
+
+    :param filepath: Path to the file
+    :param mtime_ns: Modification time of the file in nanoseconds
+    :param size: Size of the file in bytes
+    :param keyword: Keyword to search for
+    :return: Tuple of (number of matching lines, first matching lines,
+             processing time of the original search)
+    :raises OSError: When the file cannot be read, nothing is cached then
+    """
+    # Searches from earlier runs come from the on-disk cache
+    stored = _load_cached(filepath, mtime_ns, size, keyword)
+    if stored is not None:
+        count, results, processing_time = stored
+        return count, tuple(results), processing_time
+
+    if size > PROCESS_SEARCH_BYTES:
+        count, results, processing_time = _search_in_process(filepath, keyword, size)
+    else:
+        count, results, processing_time = count_matches(filepath, keyword, MAX_DISPLAYED_MATCHES)
+
+    # Reached only by a finished search, a failed one raises and lru_cache keeps nothing
+    _store_cached(filepath, mtime_ns, size, keyword, count, results, processing_time)
+    # Stored as a tuple so no caller can change the cached entry
+    return count, tuple(results), processing_time
+
+# Matching lines of finished searches, keyed by the handle their SearchResult carries.
+# Signals and the aggregation queue only pass counts, the lines are fetched once where shown.
+_RESULT_STORE: Dict[str, Sequence[str]] = {}
+_result_store_lock = threading.Lock()
+
+def store_results(results: Sequence[str]) -> str:
+    """
+    Keep matching lines until the window showing them takes them
+
+    :param results: Matching lines
+    :return: Handle to take them with
+    """
+    handle = uuid.uuid4().hex
+    with _result_store_lock:
+        _RESULT_STORE[handle] = results
+    return handle
+
+def take_results(handle: str) -> Sequence[str]:
+    """
+    Remove and return the matching lines stored under a handle
+
+    :param handle: Handle returned by store_results
+    :return: The matching lines, empty when already taken
+    """
+    with _result_store_lock:
+        return _RESULT_STORE.pop(handle, ())
+
+class SearchResult(NamedTuple):
+    """
+    Result of the search of a single file, the matching lines stay in the result store
+    """
+    window_id: int
+    filepath: str
+    match_count: int
+    processing_time: float
+    results_ref: str
+
+# Pool running the searches of every window, created on first use
+_search_pool: Optional[QThreadPool] = None
+
+def _get_search_pool() -> QThreadPool:
+    """
+    Return the pool shared by all searches, sized once for the whole application.
+    Only called from the UI thread.
+
+    :return: The search pool
+    """
+    global _search_pool
+    if _search_pool is None:
+        # The scan is CPU-bound, more threads than cores only contend for the GIL.
+        # One core is left free for the UI thread.
+        _search_pool = QThreadPool()
+        _search_pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 1))
+    return _search_pool
+
+class SearchSignals(QObject):
+    """
+    Signals of a search task, QRunnable itself cannot emit them
+    """
+    search_complete = pyqtSignal(object)
+
+class SearchTask(QRunnable):
+    """
+    Search of a single file, run on the search pool
+    """
+    def __init__(self, window_id: int, filepath: str, keyword: str,
+                 report_result: Optional[Callable[[SearchResult], None]] = None):
         super().__init__()
         self.window_id = window_id
         self.filepath = filepath
         self.keyword = keyword
-        self.search_engine = ThreadSafeSearchEngine()
+        self.signals = SearchSignals()
+
+        # Thread-safe sink of an aggregation window, also fed the result when given
+        self.report_result = report_result
+
+        # Set when a newer search replaces this one, its result is then dropped
+        self.cancel_event = threading.Event()
 
     def run(self):
         """
-        Perform search in a background thread
+        Perform search on a pool thread
         """
-        # Perform search
-        results, processing_time = self.search_engine.perform_search(self.filepath, self.keyword)
-        
-        # Prepare result dictionary
-        result_dict = {
-            'window_id': self.window_id,
-            'filepath': self.filepath,
-            'results': results,
-            'processing_time': processing_time
-        }
+        # Replaced while still waiting in the pool
+        if self.cancel_event.is_set():
+            return
+
+        # Perform search, repeated queries on an unchanged file come from the cache.
+        # Failed searches raise, so they are never cached.
+        try:
+            st = os.stat(self.filepath)
+            # The cached tuple is never changed, so it is stored without a copy
+            count, results, processing_time = _cached_search(
+                self.filepath, st.st_mtime_ns, st.st_size, self.keyword
+            )
+        except Exception as e:
+            # A failed search still reports a result, the window waits for it
+            # to re-enable its search button
+            print(f"Error searching {self.filepath}: {e}")
+            count, results, processing_time = 0, (), 0.0
         
+        # Replaced during the search, nobody waits for this result any more
+        if self.cancel_event.is_set():
+            return
+
+        # Prepare result
+        result = SearchResult(
+            self.window_id, self.filepath, count, processing_time, store_results(results)
+        )
+
         # Emit results
-        self.search_complete.emit(result_dict)
+        self.signals.search_complete.emit(result)
+        if self.report_result is not None:
+            self.report_result(result)
 
 class ResultAggregationWindow(QMainWindow):
     """
@@ -48,9 +353,23 @@ class ResultAggregationWindow(QMainWindow):
     def __init__(self, total_windows: int):
         super().__init__()
         self.total_windows = total_windows
-        self.completed_searches = 0
-        self.all_results = []
-        self.start_time = time.time()
+        # One summary line per result, formatted when the result arrives
+        self.summary_lines: List[str] = []
+        self.total_matches = 0
+        self.start_time = time.perf_counter()
+
+        # Search workers put results here; the UI thread drains it in batches.
+        # The worker reporting for the last window that had not reported yet also
+        # puts a None sentinel. Windows are tracked rather than reports, since a
+        # window may search again before the others finish.
+        self.result_queue = queue.Queue()
+        self.reported_windows = set()
+        self.reported_lock = threading.Lock()
+        # The timer keeps running after the summary is shown, a window searching
+        # again still reports to this window. Workers cannot restart it themselves.
+        self.drain_timer = QTimer(self)
+        self.drain_timer.timeout.connect(self.drain_results)
+        self.drain_timer.start(50)
         
         self.initUI()
 
@@ -83,76 +402,128 @@ class ResultAggregationWindow(QMainWindow):
         main_layout.addWidget(self.results_table)
 
         # Overall Results Display
-        self.overall_results_display = QTextEdit()
+        self.overall_results_display = QPlainTextEdit()
         self.overall_results_display.setReadOnly(True)
+        self.overall_results_display.setMaximumBlockCount(MAX_DISPLAY_LINES)
         main_layout.addWidget(self.overall_results_display)
 
-    def add_search_result(self, result_dict: dict):
+    def add_search_result(self, result: SearchResult):
         """
-        Add search result from a thread
+        Add search result from a thread, safe to call from any thread
         
-        :param result_dict: Dictionary containing search results
+        :param result: Search result
         """
-        self.all_results.append(result_dict)
-        self.completed_searches += 1
+        self.result_queue.put(result)
 
-        # Check if all searches are complete
-        if self.completed_searches == self.total_windows:
-            self.show_aggregated_results()
+        # Exactly one caller completes the set of windows
+        with self.reported_lock:
+            new_window = result.window_id not in self.reported_windows
+            self.reported_windows.add(result.window_id)
+            completed = new_window and len(self.reported_windows) == self.total_windows
+        if completed:
+            self.result_queue.put(None)
 
-    def show_aggregated_results(self):
+    def drain_results(self):
         """
-        Display aggregated search results
+        Move all queued results into the table in one batch
         """
-        # Clear previous results
-        self.results_table.setRowCount(0)
+        batch = []
+        finished = False
+        while True:
+            try:
+                result = self.result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if result is None:
+                finished = True
+            else:
+                batch.append(result)
+
+        if batch:
+            self.add_rows(batch)
+
+        # The sentinel follows the last result, everything has been shown
+        if finished:
+            self.show_aggregated_results()
 
-        # Calculate overall processing time
-        end_time = time.time()
-        overall_processing_time = end_time - self.start_time
+    def add_rows(self, batch: List[SearchResult]):
+        """
+        Add a batch of results to the table and the summary lines
 
-        # Populate results table
-        for result in self.all_results:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            
-            # Window ID
-            self.results_table.setItem(row, 0, QTableWidgetItem(str(result['window_id'])))
+        :param batch: Search results to add
+        """
+
+        # Add the rows with a single resize and repaint. Sorting is suspended meanwhile,
+        # otherwise a sorted table would move rows while their cells are being set.
+        first_row = self.results_table.rowCount()
+        sorting = self.results_table.isSortingEnabled()
+        self.results_table.setUpdatesEnabled(False)
+        self.results_table.setSortingEnabled(False)
+        # No itemChanged emissions while the cells are set, nothing needs them per cell
+        with QSignalBlocker(self.results_table):
+            self.results_table.setRowCount(first_row + len(batch))
+            for row, result in enumerate(batch, start=first_row):
+                # Format each field once, for both the table and the summary
+                window_str = str(result.window_id)
+                filepath = result.filepath
+                match_count = result.match_count
+                matches_str = str(match_count)
+                time_str = f"{result.processing_time:.4f}"
+
+                # Window ID
+                self.results_table.setItem(row, 0, QTableWidgetItem(window_str))
             
-            # File Path
-            self.results_table.setItem(row, 1, QTableWidgetItem(result['filepath']))
+                # File Path
+                self.results_table.setItem(row, 1, QTableWidgetItem(filepath))
             
-            # Matches
-            matches_str = str(len(result['results']))
-            self.results_table.setItem(row, 2, QTableWidgetItem(matches_str))
+                # Matches
+                self.results_table.setItem(row, 2, QTableWidgetItem(matches_str))
             
-            # Processing Time
-            time_str = f"{result['processing_time']:.4f}"
-            self.results_table.setItem(row, 3, QTableWidgetItem(time_str))
+                # Processing Time
+                self.results_table.setItem(row, 3, QTableWidgetItem(time_str))
+
+                self.total_matches += match_count
+                self.summary_lines.append(
+                    f"Window {window_str}: {matches_str} matches in {filepath} "
+                    f"(Processing Time: {time_str} s)"
+                )
+        self.results_table.setSortingEnabled(sorting)
+        self.results_table.setUpdatesEnabled(True)
+
+    def show_aggregated_results(self):
+        """
+        Display aggregated search results
+        """
+        # Calculate overall processing time
+        end_time = time.perf_counter()
+        overall_processing_time = end_time - self.start_time
 
         # Prepare overall results text
         overall_results = [
             f"Total Search Windows: {self.total_windows}",
             f"Overall Processing Time: {overall_processing_time:.4f} seconds",
-            "\nIndividual Window Results:"
+            f"Total Matches: {self.total_matches}",
+            "\nIndividual Window Results:",
+            *self.summary_lines
         ]
 
-        for result in self.all_results:
-            overall_results.append(
-                f"Window {result['window_id']}: "
-                f"{len(result['results'])} matches in {result['filepath']} "
-                f"(Processing Time: {result['processing_time']:.4f} s)"
-            )
-
         # Display overall results
         self.overall_results_display.setPlainText('\n'.join(overall_results))
 
 class FileSearchApp(QMainWindow):
+    # Directory of the last selected file, shared by all windows so the
+    # dialog opens there instead of listing the home directory again
+    last_directory = ''
+
     def __init__(self, window_id: int = 1, results_aggregator: Optional[ResultAggregationWindow] = None):
         super().__init__()
         self.window_id = window_id
         self.results_aggregator = results_aggregator
-        self.search_thread = None
+
+        # Search currently running for this window, if any
+        self.search_task: Optional[SearchTask] = None
+        self.search_signals: Optional[SearchSignals] = None
+
         self.initUI()
 
     def initUI(self):
@@ -189,27 +560,33 @@ class FileSearchApp(QMainWindow):
         controls_layout.addWidget(self.keyword_input)
 
         # Search Button
-        search_btn = QPushButton('Search')
-        search_btn.clicked.connect(self.start_search)
-        controls_layout.addWidget(search_btn)
+        self.search_btn = QPushButton('Search')
+        self.search_btn.clicked.connect(self.start_search)
+        controls_layout.addWidget(self.search_btn)
 
         main_layout.addLayout(controls_layout)
 
         # Results Display
-        self.results_display = QTextEdit()
+        self.results_display = QPlainTextEdit()
         self.results_display.setReadOnly(True)
+        self.results_display.setMaximumBlockCount(MAX_DISPLAY_LINES)
         main_layout.addWidget(self.results_display)
 
     def select_file(self):
         """
         Open file dialog to select single file
         """
+        # Skip symlink resolution and custom icon lookups, which stat every entry
+        # and can stall the dialog for a long time on network mounts
         file_path, _ = QFileDialog.getOpenFileName(
             self, 
             'Select File', 
-            '', 
-            'Text Files (*.txt *.log *.md);;All Files (*)'
+            FileSearchApp.last_directory, 
+            'Text Files (*.txt *.log *.md);;All Files (*)',
+            options=QFileDialog.DontResolveSymlinks | QFileDialog.DontUseCustomDirectoryIcons
         )
+        if file_path:
+            FileSearchApp.last_directory = os.path.dirname(file_path)
         self.file_input.setText(file_path)
 
     def start_search(self):
@@ -223,35 +600,56 @@ class FileSearchApp(QMainWindow):
             self.results_display.setPlainText('Please provide file and keyword')
             return
 
+        # Cancel a search still running, its result would only overwrite this one
+        if self.search_task is not None:
+            self.search_task.cancel_event.set()
+
         # Clear previous results
         self.results_display.clear()
 
-        # Create and start search thread
-        self.search_thread = SearchThread(self.window_id, filepath, keyword)
-        self.search_thread.search_complete.connect(self.display_results)
-        self.search_thread.start()
+        # Submit the search to the shared thread pool, the aggregation window
+        # receives the result straight from the worker
+        report_result = self.results_aggregator.add_search_result if self.results_aggregator else None
+        task = SearchTask(self.window_id, filepath, keyword, report_result)
+        task.signals.search_complete.connect(self.display_results)
+        self.search_task = task
+        self.search_signals = task.signals
+
+        # Ignore further clicks until the result is shown
+        self.search_btn.setEnabled(False)
+        _get_process_pool()
+        _get_search_pool().start(task)
 
-    def display_results(self, result_dict: dict):
+    def display_results(self, result: SearchResult):
         """
         Display search results in the text area
         
-        :param result_dict: Dictionary containing search results
+        :param result: Search result
         """
-        results = result_dict['results']
+        # Take the matching lines first, so a dropped result frees them as well
+        results = take_results(result.results_ref)
+
+        # A result emitted just before its search was replaced
+        if self.sender() is not self.search_signals:
+            return
+        self.search_task = None
+        self.search_signals = None
+        self.search_btn.setEnabled(True)
         
-        if not results:
+        if not result.match_count:
             self.results_display.setPlainText('No matches found.')
             return
 
-        # Format results
-        formatted_results = [
-            f"Matches in {result_dict['filepath']}:",
-            *results,
-            f"\nProcessing Time: {result_dict['processing_time']:.4f} seconds"
-        ]
-
-        self.results_display.setPlainText('\n'.join(formatted_results))
-
-        # Add results to aggregation window if available
-        if self.results_aggregator:
-            self.results_aggregator.add_search_result(result_dict)
\ No newline at end of file
+        # Append the results in chunks, the display lays out only the new lines
+        # and keeps at most MAX_DISPLAY_LINES of them
+        self.results_display.clear()
+        self.results_display.appendPlainText(f"Matches in {result.filepath}:")
+        # Only the first MAX_DISPLAYED_MATCHES lines were decoded by the search
+        shown = len(results)
+        for start in range(0, shown, DISPLAY_CHUNK_LINES):
+            self.results_display.appendPlainText('\n'.join(results[start:start + DISPLAY_CHUNK_LINES]))
+        if result.match_count > shown:
+            self.results_display.appendPlainText(f"... +{result.match_count - shown} more matches")
+        self.results_display.appendPlainText(
+            f"\nProcessing Time: {result.processing_time:.4f} seconds"
+        )
\ No newline at end of file
@@ -1,14 +1,19 @@
+import multiprocessing
+import os
 import sys
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QPushButton, QTextEdit, 
-    QFileDialog, QTableWidget, QTableWidgetItem, 
+    QFileDialog, QTableView, 
     QWidget, QMessageBox
 )
+from PyQt5.QtCore import QTimer
 
+from search_engine import format_match, prefetch_files
 from search_thread import SearchThread
-from result_aggregation_window import ResultAggregationWindow
+from result_aggregation_window import ResultAggregationWindow, ResultsModel
 
 class FileSearchApp(QMainWindow):
     def __init__(self):
@@ -20,6 +25,18 @@ class FileSearchApp(QMainWindow):
         # Core application state
         self.search_threads: List[SearchThread] = []
         self.file_paths: List[str] = []
+
+        # Results waiting to be added to the table in the next batch
+        self.pending_results: List[dict] = []
+
+        # Number of matching lines already shown per window
+        self.displayed_matches: Dict[int, int] = {}
+
+        # Worker processes for the CPU-bound scans, so searches are not serialized by the GIL.
+        # Spawned rather than forked: a fork would copy the Qt state of this process.
+        self.pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn')
+        )
         
         # Setup main UI
         self.setup_ui()
@@ -87,12 +104,11 @@ class FileSearchApp(QMainWindow):
         
         # Add table for displaying detailed search results
         
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels([
+        self.results_model = ResultsModel([
             'Window', 'File Path', 'Matches', 'Processing Time (s)'
-        ])
-        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        ], self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         main_layout.addWidget(self.results_table)
 
     def add_overall_results_display(self, main_layout):
@@ -221,7 +237,9 @@ class FileSearchApp(QMainWindow):
         
         # Reset search results display
         
-        self.results_table.setRowCount(0)
+        self.pending_results.clear()
+        self.displayed_matches.clear()
+        self.results_model.clear()
         self.overall_results.clear()
 
     def initialize_search_threads(self, results_aggregator):
@@ -232,30 +250,52 @@ class FileSearchApp(QMainWindow):
         self.search_threads.clear()
         keyword = self.keyword_input.text().strip()
 
+        # Start reading every selected file before any scan is dispatched
+        prefetch_files([filepath for filepath in self.file_paths if filepath])
+
         for i, filepath in enumerate(self.file_paths):
             if filepath:  # Only create thread for windows with selected files
-                thread = SearchThread(i+1, filepath, keyword)
+                thread = SearchThread(i+1, filepath, keyword, self.pool)
+                thread.partial_complete.connect(self.append_partial_results)
                 thread.search_complete.connect(self.process_search_result)
                 thread.search_complete.connect(results_aggregator.add_search_result)
                 thread.start()
                 self.search_threads.append(thread)
 
+    def append_partial_results(self, partial: dict):
+        
+        # Show a batch of matching lines as soon as it arrives.
+        # SearchThread only sends the lines within its display limit.
+        
+        window_id = partial['window_id']
+        batch = partial['batch']
+        self.displayed_matches[window_id] = self.displayed_matches.get(window_id, 0) + len(batch)
+
+        batch_text = [f"Window {window_id} Matching Lines ({partial['filepath']}):"]
+        batch_text.extend(format_match(match) for match in batch)
+        self.overall_results.append("\n".join(batch_text))
+
     def process_search_result(self, result: dict):
         
-        # Process and display individual search thread results
+        # Queue an individual search thread result for display.
+        # Results arriving within 50 ms of each other are added to the table together.
         
+        if not self.pending_results:
+            QTimer.singleShot(50, self.flush_pending_results)
+        self.pending_results.append(result)
+
+    def flush_pending_results(self):
         
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
+        # Add all queued results to the table with a single row insertion
         
+        pending, self.pending_results = self.pending_results, []
+
         # Populate results table
-        self.results_table.setItem(row, 0, QTableWidgetItem(str(result['window_id'])))
-        self.results_table.setItem(row, 1, QTableWidgetItem(result['filepath']))
-        self.results_table.setItem(row, 2, QTableWidgetItem(str(result['match_count'])))
-        self.results_table.setItem(row, 3, QTableWidgetItem(f"{result['processing_time']:.4f}"))
+        self.results_model.add_results(pending)
 
         # Display detailed results
-        self.display_detailed_results(result)
+        for result in pending:
+            self.display_detailed_results(result)
 
     def display_detailed_results(self, result: dict):
         
@@ -268,14 +308,22 @@ class FileSearchApp(QMainWindow):
             f"Matches: {result['match_count']}",
             f"Processing Time: {result['processing_time']:.4f} seconds"
         ]
+        if 'error' in result:
+            result_text.append(f"Error: {result['error']}")
 
-        # Add matching lines if available
-        if result['results']:
-            result_text.append("\nMatching Lines:")
-            result_text.extend(result['results'])
+        # Matching lines were shown as their batches arrived, note the ones left out
+        hidden = result['match_count'] - self.displayed_matches.get(result['window_id'], 0)
+        if hidden > 0:
+            result_text.append(f"... {hidden} more matches not shown")
 
         result_text.append("-" * 50 + "\n")
 
-        # Update overall results display
-        current_text = self.overall_results.toPlainText()
-        self.overall_results.setPlainText(current_text + "\n".join(result_text))
+        # Append to the overall results display instead of rewriting the whole document
+        self.overall_results.append("\n".join(result_text))
+
+    def closeEvent(self, event):
+        
+        # Release the worker processes when the main window closes
+        
+        self.pool.shutdown(wait=False)
+        super().closeEvent(event)
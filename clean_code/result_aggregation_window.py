@@ -1,26 +1,97 @@
 import time
+from typing import List, Optional
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt5.QtWidgets import (
-    QMainWindow, QVBoxLayout, QTextEdit, QTableWidget, 
-    QTableWidgetItem, QWidget
+    QMainWindow, QVBoxLayout, QTextEdit, QTableView, QWidget
 )
 
+class ResultsModel(QAbstractTableModel):
+
+    # Table model serving search results straight from parallel columns,
+    # so no per-cell item objects are created
+
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self.headers = headers
+
+        # Results kept as parallel columns rather than a list of dicts
+        self.window_ids: List[int] = []
+        self.paths: List[str] = []
+        self.counts: List[int] = []
+        self.times: List[float] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.window_ids)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole) -> Optional[str]:
+
+        # Format a cell only when the view asks for it
+
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return str(self.window_ids[row])
+        if column == 1:
+            return self.paths[row]
+        if column == 2:
+            return str(self.counts[row])
+        return f"{self.times[row]:.4f}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def add_results(self, results: List[dict]):
+
+        # Append a batch of results with a single row insertion notification
+
+        if not results:
+            return
+
+        first_row = len(self.window_ids)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(results) - 1)
+        for result in results:
+            self.window_ids.append(result['window_id'])
+            self.paths.append(result['filepath'])
+            self.counts.append(result['match_count'])
+            self.times.append(result['processing_time'])
+        self.endInsertRows()
+
+    def clear(self):
+
+        # Remove all results
+
+        self.beginResetModel()
+        self.window_ids.clear()
+        self.paths.clear()
+        self.counts.clear()
+        self.times.clear()
+        self.endResetModel()
+
+
 class ResultAggregationWindow(QMainWindow):
-    
+
     # Window to aggregate and display search results from all threads
-    
+
     def __init__(self, total_windows: int):
         super().__init__()
         self.total_windows = total_windows
         self.completed_searches = 0
-        self.all_results = []
         self.start_time = time.time()
-        
+
         self.initUI()
 
     def initUI(self):
-        
+
         # Initialize the Results Aggregation User Interface
-        
+
         self.setWindowTitle('Search Results Aggregation')
         self.setGeometry(200, 200, 800, 600)
 
@@ -32,15 +103,53 @@ class ResultAggregationWindow(QMainWindow):
         main_layout = QVBoxLayout()
         central_widget.setLayout(main_layout)
 
+        # Results Table
+        self.results_model = ResultsModel([
+            'Window ID', 'File Path', 'Matches', 'Processing Time (s)'
+        ], self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        main_layout.addWidget(self.results_table)
+
+        # Overall Results Display
+        self.overall_results_display = QTextEdit()
+        self.overall_results_display.setReadOnly(True)
+        main_layout.addWidget(self.overall_results_display)
 
     def add_search_result(self, result_dict: dict):
-        
-        # Add search result from a thread
-                
-        self.all_results.append(result_dict)
+
+        # Add search result from a thread, the table shows it right away
+
+        self.results_model.add_results([result_dict])
         self.completed_searches += 1
 
         # Check if all searches are complete
         if self.completed_searches == self.total_windows:
             self.show_aggregated_results()
 
+    def show_aggregated_results(self):
+
+        # Display aggregated search results
+
+        # Calculate overall processing time
+        end_time = time.time()
+        overall_processing_time = end_time - self.start_time
+
+        model = self.results_model
+
+        # Prepare overall results text
+        overall_results = [
+            f"Total Search Windows: {self.total_windows}",
+            f"Overall Processing Time: {overall_processing_time:.4f} seconds",
+            f"Total Matches: {sum(model.counts)}",
+            "\nIndividual Window Results:"
+        ]
+
+        for window_id, path, count, elapsed in zip(model.window_ids, model.paths, model.counts, model.times):
+            overall_results.append(
+                f"Window {window_id}: "
+                f"{count} matches in {path} "
+                f"(Processing Time: {elapsed:.4f} s)"
+            )
+
+        self.overall_results_display.setPlainText('\n'.join(overall_results))
@@ -1,61 +1,373 @@
+import codecs
 import os
-import time
 import threading
-from typing import List, Optional, Tuple
+import time
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional, Tuple
 
-class ThreadSafeSearchEngine:
-    
-    # Thread-safe search engine for efficient file searching
-    
-    def __init__(self):
-        self.search_results: List[str] = []
-        self.results_lock = threading.Lock()
-        self.total_processing_time = 0.0
-
-    def search_file(self, filepath: str, keyword: str) -> Tuple[Optional[List[str]], float]:
-        
-        # Search for all occurrences of a keyword in a file.
-        
-
-        
-        start_time = time.time()
-        keyword_lower = keyword.lower()
+# Size of each read when streaming a file through the scan
+CHUNK_SIZE = 1 << 20
+
+# Number of finished searches remembered for repeat queries
+RESULT_CACHE_SIZE = 128
+
+# Searches with more matches than this are run again instead of being remembered
+MAX_CACHED_MATCHES = 10000
+
+# A single match: (line number, position within the line, stripped line text)
+MatchRecord = Tuple[int, int, str]
+
+# Matches of finished searches per (file path, mtime_ns, size, needle), shared by all
+# engines, so a modified file simply misses. Stored as tuples so callers cannot change them.
+_result_cache: Dict[tuple, Tuple[MatchRecord, ...]] = {}
+_result_cache_lock = threading.Lock()
+
+
+class SkippedFileError(Exception):
+
+    # Raised for a file that is not searched, e.g. a binary file; str() gives the reason
+
+    pass
+
+
+def format_match(match: MatchRecord) -> str:
+
+    # Render a match record for display
+
+    line_num, position, line = match
+    return f"Line {line_num}: {line} (Position: {position})"
+
+
+def _prefetch(filepath: str) -> int:
+
+    # Open a file for reading and hint the kernel that it will be read sequentially
+    # and soon, so readahead starts before the scan does. Returns the raw fd.
+    # The hints are skipped where posix_fadvise is not available.
+
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    if hasattr(os, 'posix_fadvise'):
         try:
-            matches = []
-            with open(filepath, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, start=1):
-                    line_lower = line.lower()
-                    start_idx = 0
-                    while (match_idx := line_lower.find(keyword_lower, start_idx)) != -1:
-                        # Record the occurrence with line number and position
-                        matches.append(f"Line {line_num}: {line.strip()} (Position: {match_idx})")
-                        start_idx = match_idx + len(keyword_lower)  # Move past the current match
-            end_time = time.time()
-            processing_time = end_time - start_time
-            return (matches if matches else None, processing_time)
-        except (IOError, PermissionError) as e:
-            end_time = time.time()
-            processing_time = end_time - start_time
-            print(f"Error reading file {filepath}: {e}")
-            return (None, processing_time)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+    return fd
+
+
+def prefetch_files(filepaths: List[str]):
+
+    # Queue kernel readahead for every file up front, so the disk works on all of
+    # them at once before the scan workers start. Unreadable files are skipped here,
+    # their error is reported by the search itself.
+
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for filepath in filepaths:
+        try:
+            os.close(_prefetch(filepath))
+        except OSError:
+            continue
+
+
+def iter_match_offsets(block: bytes, needle: bytes, start: int = 0) -> Iterator[int]:
+
+    # Yield the start offset of every case-insensitive occurrence of the lowered needle
+    # at or after start.
+    # find() runs CPython's memchr-prefiltered Horspool/Two-Way search in C. Without
+    # cased letters the block is scanned as is, otherwise a lowered copy is scanned
+    # (bytes.lower() keeps offsets unchanged).
+
+    if len(needle) == 1 and needle.upper() != needle:
+        # A single letter: merge two memchr scans, one per case, over the block
+        # itself instead of building a lowered copy
+        upper = needle.upper()
+        lower_idx = block.find(needle, start)
+        upper_idx = block.find(upper, start)
+        while lower_idx != -1 or upper_idx != -1:
+            if upper_idx == -1 or (lower_idx != -1 and lower_idx < upper_idx):
+                yield lower_idx
+                lower_idx = block.find(needle, lower_idx + 1)
+            else:
+                yield upper_idx
+                upper_idx = block.find(upper, upper_idx + 1)
+        return
+
+    haystack = block if needle.upper() == needle else block.lower()
+    needle_len = len(needle)
+    idx = start
+    while (idx := haystack.find(needle, idx)) != -1:
+        yield idx
+        idx += needle_len
+
+
+def _char_count(data: bytes) -> int:
+
+    # Number of characters UTF-8 bytes decode to, positions are counted in characters
+
+    return len(data) if data.isascii() else len(data.decode('utf-8', errors='replace'))
+
+
+def _scan_block(block: bytes, needle: bytes, line_num: int, matches: List[MatchRecord]):
+
+    # Append the matches found in a block of whole lines starting at line_num.
+    # Only matching lines get decoded, positions are character offsets within the line.
+
+    line_start = 0
+    line_end = -1
+    line = ''
+    last_idx = 0
+    for idx in iter_match_offsets(block, needle):
+        if idx > line_end:
+            # Only count the newlines between the previous hit and this one
+            line_num += block.count(b'\n', last_idx, idx)
+            line_start = block.rfind(b'\n', 0, idx) + 1
+            line_end = block.find(b'\n', idx)
+            if line_end == -1:
+                line_end = len(block)
+            line = block[line_start:line_end].decode('utf-8', errors='replace').strip()
+            last_idx = idx
+            position = 0
+            counted = line_start
+
+        # Count on from the previous match of the line, so each byte is decoded once
+        position += _char_count(block[counted:idx])
+        counted = idx
+        matches.append((line_num, position, line))
+
+
+def _scan_block_unicode(block: bytes, needle_folded: str, line_num: int, matches: List[MatchRecord]):
+
+    # Append the matches of a keyword with non-ASCII characters, which bytes.lower()
+    # cannot lower. The block is decoded and lowered with str.lower() like the keyword,
+    # positions are character offsets within the lowered line.
+
+    text = block.decode('utf-8', errors='replace')
 
+    # Most blocks hold no match, they are ruled out with a single search
+    if needle_folded not in text.lower():
+        return
 
-    def perform_search(self, filepath: str, keyword: str) -> Tuple[List[str], float]:
-        
-        # Perform search on a single file and store results
-        
+    for line_num, line in enumerate(text.split('\n'), start=line_num):
+        for idx in _iter_text_offsets(line.lower(), needle_folded):
+            matches.append((line_num, idx, line.strip()))
+
+
+class _LongLine:
+
+    # A line longer than CHUNK_SIZE, scanned piece by piece so it is never held whole.
+    # Each piece is scanned after the last len(needle) - 1 bytes of the previous one
+    # (characters for a non-ASCII needle), so a match across a cut is still found.
+    # Matches are reported with the start of the line as its text, positions are
+    # character offsets within the line.
+
+    def __init__(self, needle, line_num: int, head: bytes):
+        self.needle = needle
+        self.line_num = line_num
+        self.text = head[:CHUNK_SIZE].decode('utf-8', errors='replace').strip()
+
+        # Position of the overlap within the line, and where the next search starts in it
+        self.offset = 0
+        self.resume = 0
+        if isinstance(needle, bytes):
+            self.overlap = b''
+            # Decodes the dropped bytes to count their characters, keeping a cut one
+            self.counter = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        else:
+            # Pieces may end inside a character, the decoder keeps it for the next one
+            self.overlap = ''
+            self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def scan(self, piece: bytes, matches: List[MatchRecord], final: bool = False):
+
+        # Append the matches of the next piece of the line; final marks the last piece
+
+        needle = self.needle
+        if isinstance(needle, bytes):
+            data = self.overlap + piece
+            offsets = iter_match_offsets(data, needle, self.resume)
+        else:
+            data = self.overlap + self.decoder.decode(piece, final)
+            haystack = data.lower()
+            offsets = _iter_text_offsets(haystack, needle, self.resume)
+
+        match_end = 0
+        if isinstance(needle, bytes):
+            # Bytes of a character cut at the last drop come before the data
+            position = self.offset
+            counted = 0
+            cut = self.counter.getstate()[0]
+            for idx in offsets:
+                position += _char_count(cut + data[counted:idx])
+                cut = b''
+                counted = idx
+                matches.append((self.line_num, position, self.text))
+                match_end = idx + len(needle)
+        else:
+            for idx in offsets:
+                matches.append((self.line_num, self.offset + idx, self.text))
+                match_end = idx + len(needle)
+        if final:
+            return
+
+        # Keep the overlap, positions are counted in the scanned (lowered) data
+        keep = len(needle) - 1
+        self.overlap = data[len(data) - keep:]
+        if isinstance(needle, bytes):
+            dropped = len(data) - keep
+            self.offset += len(self.counter.decode(data[:dropped]))
+        else:
+            dropped = len(haystack) - len(self.overlap.lower())
+            self.offset += dropped
+        self.resume = max(0, match_end - dropped)
+
+
+def _iter_text_offsets(text_lower: str, needle_folded: str, start: int = 0) -> Iterator[int]:
+
+    # Yield the start offset of every occurrence of the folded needle in lowered text
+
+    idx = start
+    while (idx := text_lower.find(needle_folded, idx)) != -1:
+        yield idx
+        idx += len(needle_folded)
+
+
+def search_file(filepath: str, needle: bytes) -> Tuple[Optional[List[MatchRecord]], float]:
+
+    # Search for all occurrences of a keyword in a file.
+    # The needle is the lowered, UTF-8 encoded keyword, prepared once by the caller.
+    # Kept at module level so it can be pickled and run in a worker process.
+    # Read errors are raised, so a failed search is never taken for one without matches.
+    # A binary file raises SkippedFileError for the same reason.
+
+    start_time = time.perf_counter_ns()
+    matches = []
+
+    # bytes.lower() only lowers ASCII, other keywords are matched on decoded text
+    if needle.isascii():
+        scan_block = _scan_block
+    else:
+        scan_block = _scan_block_unicode
+        needle = needle.decode('utf-8')
+    with open(_prefetch(filepath), 'rb') as file:
+        head = file.read(4096)
+        # NUL bytes in the first block mean a binary file, a text keyword is not searched there
+        if b'\x00' in head:
+            raise SkippedFileError("binary file, not searched")
+
+        # Stream the file in fixed chunks so memory stays bounded for any file size.
+        # Each block is cut at the last newline of its chunk and the partial line is
+        # carried into the next one, so no match or matching line is split across
+        # blocks. A line outgrowing CHUNK_SIZE is scanned in place instead.
+        line_num = 1
+        carry = b''
+        long_line = None
+        chunk = head
+        while True:
+            if chunk:
+                # The carry holds no newline, only the new chunk is searched for one
+                cut = chunk.rfind(b'\n') + 1
+                if not cut:
+                    carry += chunk
+                    if len(carry) > CHUNK_SIZE:
+                        if long_line is None:
+                            long_line = _LongLine(needle, line_num, carry)
+                        long_line.scan(carry, matches)
+                        carry = b''
+                    chunk = file.read(CHUNK_SIZE)
+                    continue
+                block, carry = carry + chunk[:cut], chunk[cut:]
+            else:
+                block, carry = carry, b''
+
+            if long_line is not None:
+                # The first line of the block ends the long line
+                line_end = block.find(b'\n')
+                if line_end == -1:
+                    line_end = len(block)
+                long_line.scan(block[:line_end], matches, final=True)
+                long_line = None
+                block = block[line_end + 1:]
+                line_num += 1
+
+            scan_block(block, needle, line_num, matches)
+            if not chunk:
+                break
+            line_num += block.count(b'\n')
+            chunk = file.read(CHUNK_SIZE)
+
+    processing_time = (time.perf_counter_ns() - start_time) / 1e9
+    return (matches if matches else None, processing_time)
+
+
+def _cached_search(filepath: str, mtime_ns: int, size: int, needle: bytes,
+                   executor: Optional[Executor]) -> Tuple[List[MatchRecord], float]:
+
+    # Run a search once per (file version, needle), answering repeated identical
+    # queries from the cache in no time. mtime_ns and size are only part of the key,
+    # so a modified file simply misses. Failed searches raise and are not remembered,
+    # neither are searches with more than MAX_CACHED_MATCHES matches.
+
+    key = (filepath, mtime_ns, size, needle)
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+    if cached is not None:
+        return list(cached), 0.0
+
+    if executor is not None:
+        results, processing_time = executor.submit(search_file, filepath, needle).result()
+    else:
+        results, processing_time = search_file(filepath, needle)
+    results = results or []
+
+    # Remember the search, dropping the oldest entry when full
+    if len(results) <= MAX_CACHED_MATCHES:
+        with _result_cache_lock:
+            if len(_result_cache) >= RESULT_CACHE_SIZE:
+                del _result_cache[next(iter(_result_cache))]
+            _result_cache[key] = tuple(results)
+    return results, processing_time
+
+
+class ThreadSafeSearchEngine:
+
+    # Search engine for efficient file searching.
+    # It keeps no per-search state, so a single instance is shared by all threads.
+
+    # Files larger than this are skipped instead of scanned, None searches files of any size
+    MAX_BYTES: Optional[int] = None
+
+    def search_file(self, filepath: str, needle: bytes) -> Tuple[Optional[List[MatchRecord]], float]:
+
+        # Search for all occurrences of a lowered needle in a file in the current process
+
+        return search_file(filepath, needle)
+
+    def perform_search(self, filepath: str, needle: bytes,
+                       executor: Optional[Executor] = None) -> Tuple[List[MatchRecord], float, Optional[str]]:
+
+        # Perform search on a single file.
+        # When an executor is given the scan runs there (e.g. a process pool).
+        # Identical queries on an unchanged file are served from the cache.
+        # Returns the matches, the processing time and, for a file that was
+        # skipped or could not be read, the reason as shown to the user.
 
-        
         try:
-            results, processing_time = self.search_file(filepath, keyword)
-            
-            # Use lock to safely update results
-            with self.results_lock:
-                if results:
-                    self.search_results.extend(results)
-                self.total_processing_time += processing_time
-            
-            return results or [], processing_time
+            st = os.stat(filepath)
+            if self.MAX_BYTES is not None and st.st_size > self.MAX_BYTES:
+                raise SkippedFileError(f"larger than {self.MAX_BYTES} bytes, not searched")
+
+            results, processing_time = _cached_search(filepath, st.st_mtime_ns, st.st_size, needle, executor)
+            return results, processing_time, None
+        except SkippedFileError as e:
+            print(f"Skipping file {filepath}: {e}")
+            return [], 0.0, str(e)
+        except (IOError, PermissionError) as e:
+            print(f"Error reading file {filepath}: {e}")
+            return [], 0.0, str(e)
         except Exception as e:
             print(f"Unexpected error in search: {e}")
-            return [], 0.0
+            return [], 0.0, str(e)
+
+
+# Process-wide engine shared by every SearchThread
+_engine = ThreadSafeSearchEngine()
@@ -1,33 +1,65 @@
+from concurrent.futures import Executor
+from typing import Optional
 from PyQt5.QtCore import QThread, pyqtSignal
-from search_engine import ThreadSafeSearchEngine
+from search_engine import _engine
 
 
 class SearchThread(QThread):
     
-    # Dedicated thread for searching a single file
+    # Dedicated thread for searching a single file.
+    # With an executor the scan itself runs in the pool, the thread only waits for it.
     
     search_complete = pyqtSignal(dict)
+    partial_complete = pyqtSignal(dict)
 
-    def __init__(self, window_id: int, filepath: str, keyword: str):
+    # Number of matches handed to the GUI per partial_complete signal
+    BATCH_SIZE = 500
+
+    # Matches handed to the GUI per search, the rest are only counted
+    MAX_DISPLAYED_MATCHES = 200
+
+    def __init__(self, window_id: int, filepath: str, keyword: str,
+                 executor: Optional[Executor] = None):
         super().__init__()
         self.window_id = window_id
         self.filepath = filepath
         self.keyword = keyword
-        self.search_engine = ThreadSafeSearchEngine()
+
+        # Lower and encode the keyword once, the scan works on bytes
+        self.keyword_lower = keyword.lower()
+        self.keyword_lower_b = self.keyword_lower.encode('utf-8')
+
+        self.executor = executor
+        self.search_engine = _engine
 
     def run(self):
         
         # Perform search in a background thread
         
-        results, processing_time = self.search_engine.perform_search(self.filepath, self.keyword)
+        results, processing_time, error = self.search_engine.perform_search(
+            self.filepath, self.keyword_lower_b, self.executor
+        )
         
-        # Prepare result dictionary
+        # Hand the displayed matches over in batches so the GUI can render them
+        # incrementally; no batch is sent once the display limit is reached
+        displayed = min(len(results), self.MAX_DISPLAYED_MATCHES)
+        for start in range(0, displayed, self.BATCH_SIZE):
+            self.partial_complete.emit({
+                'window_id': self.window_id,
+                'filepath': self.filepath,
+                'batch': results[start:min(start + self.BATCH_SIZE, displayed)]
+            })
+
+        # Prepare summary result dictionary, the count covers all matches
         result_dict = {
             'window_id': self.window_id,
             'filepath': self.filepath,
-            'results': results,
             'match_count': len(results),
             'processing_time': processing_time
         }
+
+        # A skipped or unreadable file is reported with its reason
+        if error is not None:
+            result_dict['error'] = error
         
         self.search_complete.emit(result_dict)
@@ -0,0 +1,83 @@
+import search_engine
+from search_engine import ThreadSafeSearchEngine, search_file
+
+
+def test_non_ascii_keyword_matches_any_case(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_text('Über alles\nnothing here\nüber den Fluss\nÜBER\n', encoding='utf-8')
+
+    matches, _ = search_file(str(path), 'Über'.lower().encode('utf-8'))
+
+    assert matches == [
+        (1, 0, 'Über alles'),
+        (3, 0, 'über den Fluss'),
+        (4, 0, 'ÜBER'),
+    ]
+
+
+def test_ascii_keyword_matches_any_case(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_bytes(b'Hello world\nfoo HELLO hello\n')
+
+    matches, _ = search_file(str(path), b'hello')
+
+    assert matches == [
+        (1, 0, 'Hello world'),
+        (2, 4, 'foo HELLO hello'),
+        (2, 10, 'foo HELLO hello'),
+    ]
+
+
+def test_position_counts_characters_after_non_ascii_text(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_text('café bar\n', encoding='utf-8')
+
+    matches, _ = search_file(str(path), b'bar')
+
+    assert matches == [(1, 5, 'café bar')]
+
+
+def test_long_line_is_scanned_in_place(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_engine, 'CHUNK_SIZE', 8)
+    path = tmp_path / 'text.txt'
+    path.write_bytes(b'x' * 5000 + b'hel' + b'lo' + b'y' * 5000 + b'Hello\nhello\n')
+
+    matches, _ = search_file(str(path), b'hello')
+
+    assert [match[:2] for match in matches] == [(1, 5000), (1, 10005), (2, 0)]
+
+
+def test_repeat_search_is_served_from_cache(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.write_bytes(b'hello\n')
+
+    engine = ThreadSafeSearchEngine()
+
+    first, _, _ = engine.perform_search(str(path), b'hello')
+    second, processing_time, _ = engine.perform_search(str(path), b'hello')
+
+    assert second == first == [(1, 0, 'hello')]
+    assert processing_time == 0.0
+
+
+def test_failed_search_is_not_cached(tmp_path):
+    path = tmp_path / 'text.txt'
+    path.mkdir()
+
+    engine = ThreadSafeSearchEngine()
+
+    results, processing_time, error = engine.perform_search(str(path), b'hello')
+    assert (results, processing_time) == ([], 0.0)
+    assert error
+
+    assert all(key[0] != str(path) for key in search_engine._result_cache)
+
+
+def test_binary_file_is_reported_as_skipped(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'hello\x00world\n')
+
+    results, _, error = ThreadSafeSearchEngine().perform_search(str(path), b'hello')
+
+    assert results == []
+    assert error == 'binary file, not searched'
@@ -5,112 +5,574 @@ This application provides a multi-window file search utility with parallel
 processing and consolidated result reporting.
 """
 
+import mmap
 import os
 import sys
 import time
-import threading
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 from queue import Queue
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog, 
-    QWidget, QTableWidget, QTableWidgetItem
+    QWidget, QTableView, QCheckBox
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import (
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, Qt
+)
+
+# Translation table lowering ASCII letters, built once and applied with bytes.translate
+LOWER = bytes.maketrans(
+    bytes(range(256)),
+    bytes(c | 0x20 if 0x41 <= c <= 0x5A else c for c in range(256))
+)
+
+# Size of each raw read when scanning a file
+CHUNK_SIZE = 1 << 20
+
+# Kinds of data handed out by ThreadSafeSearchEngine._read_line_blocks: whole lines,
+# a piece of a line outgrowing CHUNK_SIZE, and the piece ending that line
+LINE_BLOCK, LONG_LINE_PIECE, LONG_LINE_END = range(3)
+
+# Files at least this large are memory-mapped instead of read in chunks
+MMAP_THRESHOLD = 16 << 20
+
+# Number of finished file searches remembered by FileSearchApp for repeat queries
+RESULT_CACHE_SIZE = 128
+
+# Searches with more matching lines than this are run again instead of being remembered
+MAX_CACHED_MATCHES = 10000
+
+# Files smaller than this are searched in batches of SMALL_FILE_BATCH per pool task
+SMALL_FILE_BYTES = 256 << 10
+SMALL_FILE_BATCH = 16
+
+def open_sequential(filepath: str) -> int:
+    """
+    Open a file for raw reading and hint the kernel that it will be read
+    sequentially and soon, so readahead is enlarged and starts right away.
+
+    :param filepath: Path to the file
+    :return: Raw file descriptor, to be closed by the caller
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+    return fd
+
+def prefetch_files(filepaths: List[str]):
+    """
+    Queue kernel readahead for several files at once, so their reads are
+    in flight together before any of them is scanned. Unreadable files are
+    skipped here, the search itself reports their error.
+
+    :param filepaths: Paths of the files about to be searched
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for filepath in filepaths:
+        try:
+            os.close(open_sequential(filepath))
+        except OSError:
+            continue
+
+@lru_cache(maxsize=32)
+def compile_keyword(keyword: str) -> Tuple[bytes, Optional[List[bytes]]]:
+    """
+    Build the matcher for a keyword once; every thread of a search and
+    every repeated search with the same keyword reuse it.
+
+    :param keyword: Keyword as typed by the user
+    :return: Tuple of (lowered UTF-8 keyword, case variants for mmap scans or None)
+    """
+    keyword_lower = keyword.encode('utf-8').translate(LOWER)
+    return keyword_lower, ThreadSafeSearchEngine._case_variants(keyword_lower)
 
 class ThreadSafeSearchEngine:
     """
-    Thread-safe search engine for efficient file searching
+    Thread-safe search engine for efficient file searching.
+
+    The engine holds no state, so every thread calls it directly and
+    results are combined on the GUI thread through Qt signals.
     """
-    def __init__(self):
-        self.search_results: List[str] = []
-        self.results_lock = threading.Lock()
-        self.total_processing_time = 0.0
+    @staticmethod
+    def _case_variants(keyword_lower: bytes) -> Optional[List[bytes]]:
+        """
+        Byte strings whose plain occurrences are exactly the case-insensitive
+        occurrences of the keyword, or None when that takes a lowered copy.
+
+        :param keyword_lower: Lowered, encoded keyword
+        :return: The keyword itself when it has no cased letters, both cases
+                 of a single letter, otherwise None
+        """
+        keyword_upper = keyword_lower.upper()
+        if keyword_upper == keyword_lower:
+            return [keyword_lower]
+        if len(keyword_lower) == 1:
+            return [keyword_lower, keyword_upper]
+        return None
+
+    @staticmethod
+    def _read_line_blocks(fd: int, overlap: int) -> Iterator[Tuple[bytes, int]]:
+        """
+        Read a file in chunks and hand it out as blocks of whole lines, so no
+        match or matching line is split between blocks. Only the partial line
+        after the last newline is carried to the next chunk. A line outgrowing
+        CHUNK_SIZE is handed out in pieces instead, the first starting with the
+        line, so memory stays bounded by about two chunks.
+
+        :param fd: Raw file descriptor positioned at the start of the file
+        :param overlap: Bytes of a piece repeated at the start of the next one,
+                        enough for a match cut between them
+        :return: Iterator of (data, LINE_BLOCK, LONG_LINE_PIECE or LONG_LINE_END)
+        """
+        carry = b''
+        long_line = False
+        while True:
+            buf = os.read(fd, CHUNK_SIZE)
+
+            # The carry holds no newline, so only the new chunk is searched for one
+            if buf:
+                cut = buf.rfind(b'\n') + 1
+                if not cut:
+                    carry += buf
+                    if len(carry) > CHUNK_SIZE:
+                        # Too long to keep whole: hand it out and keep only the overlap
+                        yield carry, LONG_LINE_PIECE
+                        long_line = True
+                        carry = carry[max(0, len(carry) - overlap):]
+                    continue
+                block, carry = carry + buf[:cut], buf[cut:]
+            else:
+                block, carry = carry, b''
+
+            if long_line:
+                # The first line of the block ends the long line
+                first = block.find(b'\n') + 1 or len(block)
+                yield block[:first], LONG_LINE_END
+                block = block[first:]
+                long_line = False
+
+            if block:
+                yield block, LINE_BLOCK
+            if not buf:
+                return
+
+    @staticmethod
+    def _scan_stream(fd: int, keyword_lower: bytes, collect_matches: bool) -> Tuple[int, List[str]]:
+        """
+        Find matching lines by reading the file in chunks
 
-    def search_file(self, filepath: str, keyword: str) -> Tuple[Optional[List[str]], float]:
+        :param fd: Raw file descriptor positioned at the start of the file
+        :param keyword_lower: Lowered, encoded keyword
+        :param collect_matches: Also return the matching lines, not only their count
+        :return: Tuple of (number of matching lines, matching lines)
+        """
+        match_count = 0
+        matches = []
+
+        # Start of a line outgrowing CHUNK_SIZE, and whether it matched so far
+        long_head = None
+        long_hit = False
+
+        # A match cut between two pieces of a long line lies within len(keyword) - 1 bytes
+        overlap = len(keyword_lower) - 1
+        for block, kind in ThreadSafeSearchEngine._read_line_blocks(fd, overlap):
+            if kind != LINE_BLOCK:
+                # A long line is searched piece by piece and reported by its start
+                if long_head is None:
+                    long_head = block[:CHUNK_SIZE]
+                long_hit = long_hit or keyword_lower in block.translate(LOWER)
+                if kind == LONG_LINE_END:
+                    if long_hit:
+                        match_count += 1
+                        if collect_matches:
+                            matches.append(long_head.rstrip(b'\r').decode('utf-8', errors='replace'))
+                    long_head = None
+                    long_hit = False
+                continue
+
+            low = block.translate(LOWER)
+            idx = 0
+            while (idx := low.find(keyword_lower, idx)) != -1:
+                line_start = block.rfind(b'\n', 0, idx) + 1
+                line_end = block.find(b'\n', idx)
+                if line_end == -1:
+                    line_end = len(block)
+                match_count += 1
+                if collect_matches:
+                    # The slice stops before the newline, only a CR of a CRLF ending is left
+                    # to trim; indentation is kept and only this line is decoded
+                    matches.append(block[line_start:line_end].rstrip(b'\r').decode('utf-8', errors='replace'))
+                idx = line_end  # Each matching line is reported once
+        return match_count, matches
+
+    @staticmethod
+    def _scan_stream_unicode(fd: int, keyword_folded: str, collect_matches: bool) -> Tuple[int, List[str]]:
+        """
+        Collect matching lines for a keyword with non-ASCII characters, which
+        the ASCII translate table cannot lower. Blocks that are pure ASCII
+        cannot contain such a keyword and are skipped without decoding;
+        the others are decoded and lowered with str.lower().
+
+        :param fd: Raw file descriptor positioned at the start of the file
+        :param keyword_folded: Keyword lowered with str.lower()
+        :param collect_matches: Also return the matching lines, not only their count
+        :return: Tuple of (number of matching lines, matching lines)
+        """
+        match_count = 0
+        matches = []
+
+        # Start of a line outgrowing CHUNK_SIZE, and whether it matched so far
+        long_head = None
+        long_hit = False
+
+        # Enough bytes for the keyword in any encoding
+        overlap = 4 * len(keyword_folded)
+        for block, kind in ThreadSafeSearchEngine._read_line_blocks(fd, overlap):
+            if block.isascii():
+                # Cannot contain the keyword, but may still end a long line
+                found = False
+            else:
+                text = block.decode('utf-8', errors='replace')
+                found = keyword_folded in text.lower()
+
+            if kind != LINE_BLOCK:
+                # A long line is searched piece by piece and reported by its start
+                if long_head is None:
+                    long_head = block[:CHUNK_SIZE]
+                long_hit = long_hit or found
+                if kind == LONG_LINE_END:
+                    if long_hit:
+                        match_count += 1
+                        if collect_matches:
+                            matches.append(long_head.rstrip(b'\r').decode('utf-8', errors='replace'))
+                    long_head = None
+                    long_hit = False
+                continue
+
+            if found:
+                for line in text.split('\n'):
+                    if keyword_folded in line.lower():
+                        match_count += 1
+                        if collect_matches:
+                            matches.append(line.rstrip('\r'))
+        return match_count, matches
+
+    @staticmethod
+    def _scan_mapped(fd: int, variants: List[bytes], collect_matches: bool) -> Tuple[int, List[str]]:
+        """
+        Collect matching lines by searching a memory map of the file in place.
+        Pages are faulted in by the kernel as the search advances, so there is
+        no read loop and no lowered copy of the data.
+
+        :param fd: Raw file descriptor of a non-empty file
+        :param variants: Byte strings to find, see _case_variants
+        :param collect_matches: Also return the matching lines, not only their count
+        :return: Tuple of (number of matching lines, matching lines)
+        """
+        match_count = 0
+        matches = []
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            # Next hit of each variant, merged in file order
+            hits = [mm.find(variant) for variant in variants]
+            while True:
+                pending = [hit for hit in hits if hit != -1]
+                if not pending:
+                    break
+                idx = min(pending)
+                line_start = mm.rfind(b'\n', 0, idx) + 1
+                line_end = mm.find(b'\n', idx)
+                if line_end == -1:
+                    line_end = len(mm)
+                match_count += 1
+                if collect_matches:
+                    matches.append(mm[line_start:line_end].rstrip(b'\r').decode('utf-8', errors='replace'))
+
+                # Each matching line is reported once
+                hits = [
+                    mm.find(variant, line_end) if hit != -1 and hit < line_end else hit
+                    for variant, hit in zip(variants, hits)
+                ]
+        return match_count, matches
+
+    @staticmethod
+    def search_file(filepath: str, keyword: str,
+                    collect_matches: bool = True) -> Tuple[Optional[int], Optional[List[str]], float]:
         """
         Search for keyword in a single file.
         
         :param filepath: Path to the file to search
         :param keyword: Keyword to search for
-        :return: Tuple of (matching lines or None, processing time)
+        :param collect_matches: Also return the matching lines; when False only
+                                they are counted, without decoding or copying them
+        :return: Tuple of (number of matching lines or None when the file could not be read,
+                 matching lines or None, processing time)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        keyword_lower, variants = compile_keyword(keyword)
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                matches = [line.strip() for line in file if keyword.lower() in line.lower()]
-                end_time = time.time()
-                processing_time = end_time - start_time
-                return (matches if matches else None, processing_time)
+            fd = open_sequential(filepath)
+            try:
+                if not keyword.isascii():
+                    match_count, matches = ThreadSafeSearchEngine._scan_stream_unicode(
+                        fd, keyword.lower(), collect_matches
+                    )
+                elif variants and os.fstat(fd).st_size >= MMAP_THRESHOLD:
+                    match_count, matches = ThreadSafeSearchEngine._scan_mapped(fd, variants, collect_matches)
+                else:
+                    match_count, matches = ThreadSafeSearchEngine._scan_stream(fd, keyword_lower, collect_matches)
+            finally:
+                os.close(fd)
+            end_time = time.perf_counter()
+            processing_time = end_time - start_time
+            return (match_count, matches if matches else None, processing_time)
         except (IOError, PermissionError) as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             processing_time = end_time - start_time
             print(f"Error reading file {filepath}: {e}")
-            return (None, processing_time)
+            return (None, None, processing_time)
 
-    def perform_search(self, filepath: str, keyword: str) -> Tuple[List[str], float]:
+    @staticmethod
+    def perform_search(filepath: str, keyword: str,
+                       collect_matches: bool = True) -> Tuple[Optional[int], List[str], float]:
         """
-        Perform search on a single file and store results
+        Perform search on a single file
         
         :param filepath: Path to the file
         :param keyword: Keyword to search for
-        :return: Tuple of (search results, processing time)
+        :param collect_matches: Also return the matching lines, not only their count
+        :return: Tuple of (match count or None when the search failed, search results, processing time)
         """
         try:
-            results, processing_time = self.search_file(filepath, keyword)
-            
-            # Use lock to safely update results
-            with self.results_lock:
-                if results:
-                    self.search_results.extend(results)
-                self.total_processing_time += processing_time
-            
-            return results or [], processing_time
+            match_count, results, processing_time = ThreadSafeSearchEngine.search_file(
+                filepath, keyword, collect_matches
+            )
+            return match_count, results or [], processing_time
         except Exception as e:
             print(f"Unexpected error in search: {e}")
-            return [], 0.0
+            return None, [], 0.0
 
-class SearchThread(QThread):
+def _is_rotational(device: int) -> bool:
     """
-    Dedicated thread for searching a single file
+    Check whether a device is a spinning disk (Linux only)
+
+    :param device: Device number as reported by os.stat().st_dev
+    :return: True for a rotational disk, False otherwise or when unknown
     """
-    search_complete = pyqtSignal(dict)
+    # os.major and os.minor only exist on Unix, elsewhere the disk type stays unknown
+    if not hasattr(os, 'major'):
+        return False
+    base = f"/sys/dev/block/{os.major(device)}:{os.minor(device)}"
+    # A partition has no queue of its own, it shares the one of its parent disk
+    for path in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):
+        try:
+            with open(path) as flag:
+                return flag.read().strip() == '1'
+        except OSError:
+            continue
+    return False
 
-    def __init__(self, window_id: int, filepath: str, keyword: str):
+def search_pool_size(filepaths: List[str]) -> int:
+    """
+    Number of search workers for a set of files.
+
+    A spinning disk gets one worker, since parallel reads only make it seek;
+    any other device gets one worker per CPU. The total is capped at
+    min(8, cpu_count) and at the number of files.
+
+    :param filepaths: Paths of the files to search
+    :return: Worker count, at least 1
+    """
+    cpu_count = os.cpu_count() or 1
+    devices = set()
+    for filepath in filepaths:
+        try:
+            devices.add(os.stat(filepath).st_dev)
+        except OSError:
+            continue
+    workers = sum(1 if _is_rotational(device) else cpu_count for device in devices)
+    return max(1, min(workers, 8, cpu_count, len(filepaths)))
+
+def plan_search_batches(jobs: List[Tuple[int, str, Optional[tuple]]]) -> List[List[Tuple[int, str, Optional[tuple]]]]:
+    """
+    Group search jobs into pool tasks. Each large file gets a task of its
+    own; small files share a task, SMALL_FILE_BATCH at a time, so their
+    per-task overhead does not outweigh the search itself.
+
+    :param jobs: (window_id, filepath, cache key) tuples
+    :return: Jobs of each task
+    """
+    batches = []
+    small_jobs = []
+    for job in jobs:
+        try:
+            small = os.path.getsize(job[1]) < SMALL_FILE_BYTES
+        except OSError:
+            small = False  # Searched alone, the search reports the error
+        if small:
+            small_jobs.append(job)
+        else:
+            batches.append([job])
+    for i in range(0, len(small_jobs), SMALL_FILE_BATCH):
+        batches.append(small_jobs[i:i + SMALL_FILE_BATCH])
+    return batches
+
+@dataclass
+class SearchResult:
+    """
+    Summary of a single file search, sent from a search task to the GUI thread.
+    The matching lines stay out of the signal, they wait in the app's result
+    store under results_ref until they are displayed.
+    generation identifies the search it belongs to; cache_key is where the
+    result may be cached, None when it must not be.
+    """
+    __slots__ = ('window_id', 'filepath', 'match_count', 'processing_time', 'results_ref',
+                 'generation', 'cache_key')
+
+    window_id: int
+    filepath: str
+    match_count: int
+    processing_time: float
+    results_ref: int
+    generation: int
+    cache_key: Optional[tuple]
+
+class SearchSignals(QObject):
+    """
+    Signals of a search task, QRunnable itself cannot emit them
+    """
+    search_complete = pyqtSignal(object)
+
+class SearchTask(QRunnable):
+    """
+    Search of one or more files, run on a shared thread pool
+    """
+    def __init__(self, jobs: List[Tuple[int, str, Optional[tuple]]], keyword: str,
+                 results_store: Dict[int, List[str]], generation: int, collect_matches: bool = True):
         super().__init__()
-        self.window_id = window_id
-        self.filepath = filepath
+        # (window_id, filepath, cache key) per file
+        self.jobs = jobs
         self.keyword = keyword
-        self.search_engine = ThreadSafeSearchEngine()
+        self.results_store = results_store
+        self.generation = generation
+
+        # Only count matching lines when they will not be displayed
+        self.collect_matches = collect_matches
+        self.signals = SearchSignals()
 
     def run(self):
         """
-        Perform search in a background thread
+        Perform search on a pool thread, emitting one result per file
         """
-        results, processing_time = self.search_engine.perform_search(self.filepath, self.keyword)
-        
-        # Prepare result dictionary
-        result_dict = {
-            'window_id': self.window_id,
-            'filepath': self.filepath,
-            'results': results,
-            'match_count': len(results),
-            'processing_time': processing_time
-        }
-        
-        self.search_complete.emit(result_dict)
+        if len(self.jobs) > 1:
+            prefetch_files([filepath for _, filepath, _ in self.jobs])
+
+        for window_id, filepath, cache_key in self.jobs:
+            match_count, results, processing_time = ThreadSafeSearchEngine.perform_search(
+                filepath, self.keyword, self.collect_matches
+            )
+
+            # A file that could not be read is shown without matches, but not cached
+            if match_count is None:
+                match_count, cache_key = 0, None
+
+            # Leave the matching lines in the store, only the summary is emitted
+            self.results_store[window_id] = results
+            
+            self.signals.search_complete.emit(SearchResult(
+                window_id, filepath, match_count, processing_time, window_id,
+                self.generation, cache_key
+            ))
+
+class ResultsModel(QAbstractTableModel):
+    """
+    Table model serving search results straight from a list of SearchResult,
+    so the view formats cells on demand instead of holding an item per cell
+    """
+    def __init__(self, headers: List[str], parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.headers = headers
+        self.results: List[SearchResult] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.results)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Optional[str]:
+        """
+        Format a cell when the view asks for it
+        """
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        result = self.results[index.row()]
+        column = index.column()
+        if column == 0:
+            return str(result.window_id)
+        if column == 1:
+            return result.filepath
+        if column == 2:
+            return str(result.match_count)
+        return f"{result.processing_time:.4f}"
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def add_results(self, results: List[SearchResult]):
+        """
+        Append a batch of results with a single row insertion notification
+
+        :param results: Results to append
+        """
+        if not results:
+            return
+
+        first_row = len(self.results)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(results) - 1)
+        self.results.extend(results)
+        self.endInsertRows()
+
+    def clear(self):
+        """
+        Remove all results
+        """
+        self.beginResetModel()
+        self.results.clear()
+        self.endResetModel()
 
 class ResultAggregationWindow(QMainWindow):
     """
     Window to aggregate and display search results from all threads
     """
-    def __init__(self, total_windows: int):
+    def __init__(self, total_windows: int, parent_app: Optional['FileSearchApp'] = None):
         super().__init__()
         self.total_windows = total_windows
         self.completed_searches = 0
-        self.all_results = []
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
+
+        # Running totals for the final summary, the table is filled as results arrive
+        self.total_matches = 0
+        self.summary_lines = []
+
+        # Rows waiting to be added to the table in the next batch
+        self.pending_rows = []
+
+        # App that also shows each result as it arrives, fed from add_search_result
+        self.parent_app = parent_app
         
         self.initUI()
 
@@ -130,11 +592,11 @@ class ResultAggregationWindow(QMainWindow):
         central_widget.setLayout(main_layout)
 
         # Results Table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels([
+        self.results_model = ResultsModel([
             'Window ID', 'File Path', 'Matches', 'Processing Time (s)'
-        ])
+        ], self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         main_layout.addWidget(self.results_table)
 
         # Overall Results Display
@@ -142,62 +604,60 @@ class ResultAggregationWindow(QMainWindow):
         self.overall_results_display.setReadOnly(True)
         main_layout.addWidget(self.overall_results_display)
 
-    def add_search_result(self, result_dict: dict):
+    def add_search_result(self, result: SearchResult):
         """
         Add search result from a thread
         
-        :param result_dict: Dictionary containing search results
+        :param result: Summary of the search of one file
         """
-        self.all_results.append(result_dict)
+        # Forward on the GUI thread, so each result crosses threads only once
+        if self.parent_app is not None:
+            self.parent_app.process_search_result(result)
+
+        # Queue the row, results arriving within 50 ms of each other are added together
+        if not self.pending_rows:
+            QTimer.singleShot(50, self.flush_rows)
+        self.pending_rows.append(result)
+
+        # Keep only what the summary needs
+        self.total_matches += result.match_count
+        self.summary_lines.append(
+            f"Window {result.window_id}: "
+            f"{result.match_count} matches in {result.filepath} "
+            f"(Processing Time: {result.processing_time:.4f} s)"
+        )
         self.completed_searches += 1
 
         # Check if all searches are complete
         if self.completed_searches == self.total_windows:
             self.show_aggregated_results()
 
+    def flush_rows(self):
+        """
+        Add all queued rows to the results table with a single insertion
+        """
+        pending, self.pending_rows = self.pending_rows, []
+        self.results_model.add_results(pending)
+
     def show_aggregated_results(self):
         """
         Display aggregated search results
         """
-        # Clear previous results
-        self.results_table.setRowCount(0)
-
         # Calculate overall processing time
-        end_time = time.time()
+        end_time = time.perf_counter()
         overall_processing_time = end_time - self.start_time
 
-        # Populate results table
-        for result in self.all_results:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            
-            # Window ID
-            self.results_table.setItem(row, 0, QTableWidgetItem(str(result['window_id'])))
-            
-            # File Path
-            self.results_table.setItem(row, 1, QTableWidgetItem(result['filepath']))
-            
-            # Matches
-            matches_str = str(result['match_count'])
-            self.results_table.setItem(row, 2, QTableWidgetItem(matches_str))
-            
-            # Processing Time
-            time_str = f"{result['processing_time']:.4f}"
-            self.results_table.setItem(row, 3, QTableWidgetItem(time_str))
+        # Add the last rows now rather than waiting for the timer
+        self.flush_rows()
 
         # Prepare overall results text
         overall_results = [
             f"Total Search Windows: {self.total_windows}",
             f"Overall Processing Time: {overall_processing_time:.4f} seconds",
+            f"Total Matches: {self.total_matches}",
             "\nIndividual Window Results:"
         ]
-
-        for result in self.all_results:
-            overall_results.append(
-                f"Window {result['window_id']}: "
-                f"{result['match_count']} matches in {result['filepath']} "
-                f"(Processing Time: {result['processing_time']:.4f} s)"
-            )
+        overall_results.extend(self.summary_lines)
 
         # Display overall results
         self.overall_results_display.setPlainText('\n'.join(overall_results))
@@ -206,8 +666,25 @@ class FileSearchApp(QMainWindow):
     def __init__(self, results_aggregator: Optional[ResultAggregationWindow] = None):
         super().__init__()
         self.results_aggregator = results_aggregator
-        self.search_threads = []
         self.file_paths = []
+
+        # Bounded pool running the searches, sized per search
+        self.thread_pool = QThreadPool()
+
+        # Results waiting to be shown in the next batch
+        self.pending_results = []
+
+        # Matching lines of the current search by window ID, written by search tasks
+        # and taken once displayed. Each search gets a new store, so tasks of a
+        # replaced search only write to the old one.
+        self.results_store: Dict[int, List[str]] = {}
+
+        # Finished searches by (path, mtime_ns, size, lowered keyword, collect_matches),
+        # so a repeated query on an unchanged file is not scanned again
+        self._cache: Dict[tuple, Tuple[int, List[str]]] = {}
+
+        # Number of the current search; results of earlier searches still running are dropped
+        self.search_generation = 0
         
         self.initUI()
 
@@ -246,6 +723,11 @@ class FileSearchApp(QMainWindow):
         self.keyword_input.setPlaceholderText('Enter search keyword')
         keyword_layout.addWidget(self.keyword_input)
 
+        # Matching lines are only collected when they will be shown
+        self.show_matches_check = QCheckBox('Show matching lines')
+        self.show_matches_check.setChecked(True)
+        keyword_layout.addWidget(self.show_matches_check)
+
         start_search_btn = QPushButton('Start Parallel Search')
         start_search_btn.clicked.connect(self.start_parallel_search)
         keyword_layout.addWidget(start_search_btn)
@@ -257,11 +739,11 @@ class FileSearchApp(QMainWindow):
         main_layout.addLayout(self.search_windows_layout)
 
         # Detailed Results Table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels([
+        self.results_model = ResultsModel([
             'Window', 'File Path', 'Matches', 'Processing Time (s)'
-        ])
+        ], self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         main_layout.addWidget(self.results_table)
 
         # Overall Results Display
@@ -289,6 +771,9 @@ class FileSearchApp(QMainWindow):
             self.overall_results.setPlainText('Please enter a valid number of windows')
             return
 
+        # One slot per window, filled in by select_file
+        self.file_paths = [''] * num_windows
+
         # Create file selection windows
         for i in range(num_windows):
             # File selection layout
@@ -326,10 +811,6 @@ class FileSearchApp(QMainWindow):
         # Update file input and store file path
         file_input.setText(file_path)
         
-        # Ensure file paths list is large enough
-        while len(self.file_paths) <= window_id:
-            self.file_paths.append('')
-        
         # Store file path
         self.file_paths[window_id] = file_path
 
@@ -344,70 +825,109 @@ class FileSearchApp(QMainWindow):
             return
 
         # Validate file paths
-        if not self.file_paths or len(self.file_paths) == 0:
+        if not any(self.file_paths):
             self.overall_results.setPlainText('Please select files for all windows')
             return
 
         # Clear previous results
-        self.results_table.setRowCount(0)
+        self.pending_results.clear()
+        self.results_store = {}
+        self.results_model.clear()
         self.overall_results.clear()
 
-        # Create results aggregation window
-        results_aggregator = ResultAggregationWindow(len(self.file_paths))
+        # Create results aggregation window, expecting one result per selected file
+        filepaths = [filepath for filepath in self.file_paths if filepath]
+        results_aggregator = ResultAggregationWindow(len(filepaths), self)
+        self.results_aggregator = results_aggregator
+        self.search_generation += 1
+        generation = self.search_generation
 
-        # Create search threads
-        self.search_threads = []
+        # Serve unchanged files from the cache, queueing their results on the event loop
+        # like any other completion; only the rest is searched
+        collect_matches = self.show_matches_check.isChecked()
+        jobs = []
         for i, filepath in enumerate(self.file_paths):
-            if filepath:  # Only create thread for windows with selected files
-                thread = SearchThread(i+1, filepath, keyword)
-                thread.search_complete.connect(self.process_search_result)
-                thread.search_complete.connect(results_aggregator.add_search_result)
-                thread.start()
-                self.search_threads.append(thread)
+            if not filepath:  # Only search windows with selected files
+                continue
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                jobs.append((i+1, filepath, None))  # The search reports the error
+                continue
+            key = (filepath, st.st_mtime_ns, st.st_size, keyword.lower(), collect_matches)
+            cached = self._cache.get(key)
+            if cached is None:
+                jobs.append((i+1, filepath, key))
+                continue
+            match_count, results = cached
+            self.results_store[i+1] = results
+            result = SearchResult(i+1, filepath, match_count, 0.0, i+1, generation, None)
+            QTimer.singleShot(0, lambda result=result: results_aggregator.add_search_result(result))
+
+        # Submit searches to the bounded pool instead of one thread per file
+        batches = plan_search_batches(jobs)
+        if batches:
+            self.thread_pool.setMaxThreadCount(
+                min(search_pool_size([filepath for _, filepath, _ in jobs]), len(batches))
+            )
+        for batch in batches:
+            task = SearchTask(batch, keyword, self.results_store, generation, collect_matches=collect_matches)
+            task.signals.search_complete.connect(results_aggregator.add_search_result)
+            self.thread_pool.start(task)
 
         # Show results aggregation window
         results_aggregator.show()
 
-    def process_search_result(self, result):
+    def process_search_result(self, result: SearchResult):
         """
-        Process search results from a thread
+        Queue search results from a thread.
+        Results arriving within 50 ms of each other are shown together.
         """
-        # Add row to results table
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
-        
-        # Window ID
-        self.results_table.setItem(row, 0, QTableWidgetItem(str(result['window_id'])))
-        
-        # File Path
-        self.results_table.setItem(row, 1, QTableWidgetItem(result['filepath']))
-        
-        # Matches
-        matches_str = str(result['match_count'])
-        self.results_table.setItem(row, 2, QTableWidgetItem(matches_str))
-        
-        # Processing Time
-        time_str = f"{result['processing_time']:.4f}"
-        self.results_table.setItem(row, 3, QTableWidgetItem(time_str))
+        # A search replaced by a newer one, its result belongs to no displayed search
+        if result.generation != self.search_generation:
+            return
 
-        # Prepare overall results text
-        overall_result_text = [
-            f"Window {result['window_id']} Results:",
-            f"File: {result['filepath']}",
-            f"Matches: {result['match_count']}",  # Show match count only once
-            f"Processing Time: {result['processing_time']:.4f} seconds"
-        ]
+        # Remember finished searches for repeat queries, dropping the oldest entry when full.
+        # A few dense files must not pin large lists of lines, those are searched again.
+        if result.cache_key is not None:
+            lines = self.results_store.get(result.results_ref, [])
+            if len(lines) <= MAX_CACHED_MATCHES:
+                if len(self._cache) >= RESULT_CACHE_SIZE:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[result.cache_key] = (result.match_count, lines)
+
+        if not self.pending_results:
+            QTimer.singleShot(50, self.flush_search_results)
+        self.pending_results.append(result)
+
+    def flush_search_results(self):
+        """
+        Show all queued search results with a single table insertion
+        """
+        pending, self.pending_results = self.pending_results, []
+
+        # Add rows to results table
+        self.results_model.add_results(pending)
+
+        for result in pending:
+            # Prepare overall results text
+            overall_result_text = [
+                f"Window {result.window_id} Results:",
+                f"File: {result.filepath}",
+                f"Matches: {result.match_count}",  # Show match count only once
+                f"Processing Time: {result.processing_time:.4f} seconds"
+            ]
         
-        # Add matches to the text
-        if result['results']:
-            overall_result_text.append("\nresults:")
-            overall_result_text.append("\n".join(result['results']))  # Add the matches here only once
+            # Add matches to the text, taking them out of the store
+            results = self.results_store.pop(result.results_ref, None)
+            if results:
+                overall_result_text.append("\nresults:")
+                overall_result_text.append("\n".join(results))  # Add the matches here only once
 
-        overall_result_text.append("-" * 50+ "\n") # Separator line
+            overall_result_text.append("-" * 50+ "\n") # Separator line
 
-        # Update the overall results display
-        current_text = self.overall_results.toPlainText()
-        self.overall_results.setPlainText(current_text + "\n".join(overall_result_text))
+            # Append to the overall results display without re-reading the whole document
+            self.overall_results.append("\n".join(overall_result_text))
 
 def main():
     """